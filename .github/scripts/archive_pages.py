@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Per-month and per-year archive pages linked from the README
+Writes Archive/YYYY-MM.md (every summary of the month with day counter and
+word count), Archive/YYYY.md (the months of the year with totals) and the
+calendar heatmap Archive/heatmap.svg.
+
+A dependency map in .summary_cache/archive.json keeps a fingerprint of the
+inputs of every page (content hashes of its summaries, START_DATE and the
+template, which decides the fill status and word totals). Only
+pages whose fingerprint changed are rendered, and in incremental mode only
+the months of the changed summaries are looked at, so the cost of an update
+does not grow with the size of the archive.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import date, datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(REPO_ROOT)
+from summary_calendar import heatmap_fingerprint, heatmap_is_current, render_heatmap
+from summary_io import CACHE_DIR, write_if_changed
+from summary_parser import extract_date_from_filename
+from summary_profile import PROFILER
+from update_readme import HEATMAP_PATH, format_summary_entry, get_file_stats
+
+ARCHIVE_DIR = 'Archive'
+DEPENDENCIES_PATH = os.path.join(CACHE_DIR, 'archive.json')
+ARCHIVE_VERSION = 3
+
+def month_page(month):
+    """'2025-08' -> 'Archive/2025-08.md'"""
+    return f'{ARCHIVE_DIR}/{month}.md'
+
+def year_page(year):
+    """'2025' -> 'Archive/2025.md'"""
+    return f'{ARCHIVE_DIR}/{year}.md'
+
+def format_month(month):
+    """'2025-08' -> 'August 2025'"""
+    return datetime.strptime(month, '%Y-%m').strftime('%B %Y')
+
+def group_by_month(summary_files):
+    """Return {'YYYY-MM': [paths, oldest first]}"""
+    months = {}
+    for filepath in sorted(summary_files, key=os.path.basename):
+        date_str = extract_date_from_filename(filepath)
+        if not date_str:
+            continue
+        try:
+            date.fromisoformat(date_str)
+        except ValueError:
+            # Names like 2025-13-40.md match the pattern but are not dates
+            continue
+        months.setdefault(date_str[:7], []).append(filepath)
+    return months
+
+def load_dependencies(path=DEPENDENCIES_PATH):
+    """Load the page fingerprint map, or an empty one"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == ARCHIVE_VERSION:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {'version': ARCHIVE_VERSION, 'start_date': None, 'template': None, 'months': {}}
+
+def filled_words(filepath, manifest):
+    """Word count of a summary, or 0 if it is still an untouched template"""
+    stats = get_file_stats(filepath, manifest)
+    return stats['word_count'] if stats['has_content'] else 0
+
+def month_fingerprint(files, manifest, start_date_str):
+    """Fingerprint of everything a month page is rendered from"""
+    digest = hashlib.sha256(f"{start_date_str}\0{manifest.template_sha()}".encode('utf-8'))
+    for filepath in files:
+        entry = manifest.get(filepath)
+        digest.update(f"\0{filepath}\0{entry['sha256'] if entry else ''}".encode('utf-8'))
+    return digest.hexdigest()
+
+def render_month_page(month, files, manifest, start_date_str):
+    """Render Archive/YYYY-MM.md"""
+    total_words = 0
+    lines = []
+    for filepath in reversed(files):
+        entry = format_summary_entry(filepath, start_date_str, manifest, link=f'../{filepath}')
+        if entry:
+            lines.append(entry)
+            total_words += filled_words(filepath, manifest)
+    return (f"# {format_month(month)}\n\n"
+            f"[← {month[:4]}]({month[:4]}.md) · [README](../README.md)\n\n"
+            + '\n'.join(lines) + "\n\n"
+            f"---\n*{len(lines)} summaries, {total_words} words*\n")
+
+def render_year_page(year, month_totals):
+    """Render Archive/YYYY.md from {month: (summaries, words)}"""
+    lines = [f"- [{format_month(month)}]({month}.md) ({count} summaries, {words} words)"
+             for month, (count, words) in sorted(month_totals.items(), reverse=True)]
+    count = sum(total[0] for total in month_totals.values())
+    words = sum(total[1] for total in month_totals.values())
+    return (f"# {year}\n\n[README](../README.md)\n\n" + '\n'.join(lines) + "\n\n"
+            f"---\n*{count} summaries, {words} words*\n")
+
+def update_heatmap(calendar, path=HEATMAP_PATH):
+    """Re-render the heatmap SVG unless the calendar window it shows is unchanged"""
+    if calendar.last is None:
+        return False
+    if heatmap_is_current(path, heatmap_fingerprint(calendar, calendar.last)):
+        return False
+    with PROFILER.phase('render'):
+        content = render_heatmap(calendar, calendar.last)
+    return write_if_changed(path, content)
+
+def update_archive(summary_files, manifest, start_date_str=None, changed_paths=None, calendar=None):
+    """Regenerate the archive pages whose inputs changed
+
+    changed_paths lists the summaries changed or deleted since the last run
+    (incremental mode); None checks every month. The heatmap is refreshed
+    too if a PresenceCalendar is given. Returns the number of pages written
+    or removed.
+    """
+    dependencies = load_dependencies()
+    months = group_by_month(summary_files)
+    template_sha = manifest.template_sha()
+
+    if (changed_paths is None or not dependencies['months'] or dependencies['start_date'] != start_date_str
+            or dependencies['template'] != template_sha):
+        candidates = set(months) | set(dependencies['months'])
+    else:
+        candidates = {date_str[:7] for date_str in map(extract_date_from_filename, changed_paths) if date_str}
+
+    written = 0
+    dirty_years = set()
+    for month in sorted(candidates):
+        files = months.get(month)
+        if not files:
+            if dependencies['months'].pop(month, None) is not None and os.path.exists(month_page(month)):
+                os.remove(month_page(month))
+                written += 1
+            dirty_years.add(month[:4])
+            continue
+
+        fingerprint = month_fingerprint(files, manifest, start_date_str)
+        if dependencies['months'].get(month, {}).get('fingerprint') == fingerprint and os.path.exists(month_page(month)):
+            continue
+        with PROFILER.phase('render'):
+            content = render_month_page(month, files, manifest, start_date_str)
+        if write_if_changed(month_page(month), content):
+            written += 1
+        words = sum(filled_words(filepath, manifest) for filepath in files)
+        dependencies['months'][month] = {'fingerprint': fingerprint, 'summaries': len(files), 'words': words}
+        dirty_years.add(month[:4])
+
+    # Year pages only depend on the totals of their months
+    for year in sorted(dirty_years):
+        month_totals = {month: (info['summaries'], info['words'])
+                        for month, info in dependencies['months'].items() if month.startswith(year)}
+        if not month_totals:
+            if os.path.exists(year_page(year)):
+                os.remove(year_page(year))
+                written += 1
+            continue
+        if write_if_changed(year_page(year), render_year_page(year, month_totals)):
+            written += 1
+
+    if calendar is not None and update_heatmap(calendar):
+        written += 1
+
+    dependencies['start_date'] = start_date_str
+    dependencies['template'] = template_sha
+    manifest.save()
+    write_if_changed(DEPENDENCIES_PATH, json.dumps(dependencies, indent=1, sort_keys=True) + '\n')
+    return written
+
+def report_archive(written):
+    """Print the outcome of update_archive()"""
+    if written:
+        print(f"Updated {written} archive pages in {ARCHIVE_DIR}/")
+    else:
+        print(f"{ARCHIVE_DIR}/ is already up to date")
@@ -4,87 +4,136 @@ Script to validate and fix day counters in summary files
 Checks if day counters match the current START_DATE configuration
 """
 
+import contextlib
 import os
-import glob
+import json
 import re
-from datetime import datetime
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
-def get_current_start_date():
-    """Get the current start date from config"""
-    try:
-        import sys
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        from config import START_DATE
-        return START_DATE
-    except ImportError:
-        return None
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(REPO_ROOT)
+from date_gaps import day_number
+from git_changes import add_change_arguments, changes_from_args
+from summary_config import get_setting, virtual_day_counters
+from summary_io import read_text, write_if_changed
+from summary_manifest import SummaryManifest
+from summary_parser import TITLE_RE, extract_date_from_filename
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+
+DAY_COUNTER_RE = re.compile(r'# Daily Summary - \d{4}-\d{2}-\d{2} \[Day (\d+)\]')
+TITLE_WITH_COUNTER_RE = re.compile(r'(# Daily Summary - \d{4}-\d{2}-\d{2}) \[Day \d+\]')
+TITLE_PREFIX_RE = re.compile(r'(# Daily Summary - \d{4}-\d{2}-\d{2})')
 
 def calculate_correct_day_counter(date_str, start_date_str):
     """Calculate the correct day counter for a given date"""
-    if not start_date_str:
-        return ""
-    
-    try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        days_diff = (date_obj - start_date).days
-        if days_diff >= 0:
-            return f" [Day {days_diff + 1}]"
-    except ValueError:
-        pass
-    
-    return ""
-
-def extract_date_from_filename(filename):
-    """Extract date from filename"""
-    basename = os.path.basename(filename)
-    date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.md$', basename)
-    return date_match.group(1) if date_match else None
+    number = day_number(date_str, start_date_str)
+    return f" [Day {number}]" if number else ""
 
 def extract_current_day_counter(content):
     """Extract current day counter from file content"""
     # Look for pattern: # Daily Summary - YYYY-MM-DD [Day XXX]
-    match = re.search(r'# Daily Summary - \d{4}-\d{2}-\d{2} \[Day (\d+)\]', content)
+    match = DAY_COUNTER_RE.search(content)
     if match:
         return match.group(1)
     # If no day counter found, return "None" to indicate missing
     return "None"
 
-def fix_day_counter_in_file(filepath, correct_day_counter):
-    """Fix the day counter in a file"""
+def read_header_day_counter(filepath):
+    """Read only the first line of a file and extract its day counter
+    
+    Returns the counter ("None" if the title has none), or None if the first
+    line is not a summary title.
+    """
+    with PROFILER.phase('read'):
+        with open(filepath, 'rb') as f:
+            header = f.readline().decode('utf-8')
+    PROFILER.count('bytes_read', len(header))
+    match = TITLE_RE.match(header)
+    if not match:
+        return None
+    return match.group(2) or "None"
+
+def rewrite_header(filepath, correct_day_counter):
+    """Rewrite only the title line of a file
+    
+    The new title is written to a temporary file, the rest of the file is
+    copied over byte for byte, and the temporary file is renamed over the
+    original. Returns True if the file was rewritten, False if the title was
+    already correct, or None if the first line is not a summary title.
+    """
+    with open(filepath, 'rb') as src:
+        header = src.readline().decode('utf-8')
+        match = TITLE_RE.match(header)
+        if not match:
+            return None
+        
+        new_header = match.group(1) + correct_day_counter + header[match.end():]
+        if new_header == header:
+            return False
+        
+        directory = os.path.dirname(filepath) or '.'
+        with PROFILER.phase('write'):
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as dst:
+                    dst.write(new_header.encode('utf-8'))
+                    shutil.copyfileobj(src, dst)
+                shutil.copymode(filepath, tmp_path)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+    PROFILER.count('files_rewritten')
+    return True
+
+def rewrite_day_counter(content, correct_day_counter):
+    """Return content with the day counter in the title replaced"""
+    if correct_day_counter:
+        # First try to replace existing day counter
+        new_content = TITLE_WITH_COUNTER_RE.sub(lambda m: m.group(1) + correct_day_counter, content)
+        
+        # If no change, try to add day counter to title without one
+        if new_content == content:
+            new_content = TITLE_PREFIX_RE.sub(lambda m: m.group(1) + correct_day_counter, content)
+        return new_content
+    
+    # Remove day counter if not needed
+    return TITLE_WITH_COUNTER_RE.sub(lambda m: m.group(1), content)
+
+def fix_day_counter_in_file(filepath, correct_day_counter, content=None, manifest=None):
+    """Fix the day counter in a file
+    
+    The title is normally on line 1, in which case only the header is
+    rewritten and the body bytes are left untouched. Otherwise the whole
+    content is rewritten. If the caller already read the file, pass its
+    content to avoid a second read; when a manifest is given it is updated.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        rewritten = rewrite_header(filepath, correct_day_counter)
+        if rewritten is not None:
+            if rewritten and manifest is not None:
+                if content is not None:
+                    manifest.record(filepath, rewrite_day_counter(content, correct_day_counter))
+                else:
+                    manifest.forget(filepath)
+            return rewritten
         
-        # Replace the title line with correct day counter
-        if correct_day_counter:
-            # First try to replace existing day counter
-            new_content = re.sub(
-                r'(# Daily Summary - \d{4}-\d{2}-\d{2}) \[Day \d+\]',
-                r'\1' + correct_day_counter,
-                content
-            )
-            
-            # If no change, try to add day counter to title without one
-            if new_content == content:
-                new_content = re.sub(
-                    r'(# Daily Summary - \d{4}-\d{2}-\d{2})',
-                    r'\1' + correct_day_counter,
-                    content
-                )
-        else:
-            # Remove day counter if not needed
-            new_content = re.sub(
-                r'(# Daily Summary - \d{4}-\d{2}-\d{2}) \[Day \d+\]',
-                r'\1',
-                content
-            )
+        # Title is not on the first line: rewrite the whole file
+        if content is None:
+            content, _data = read_text(filepath)
         
-        # Only write if content changed
-        if new_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+        new_content = rewrite_day_counter(content, correct_day_counter)
+        
+        # Only write (atomically) if content changed
+        if new_content != content and write_if_changed(filepath, new_content):
+            PROFILER.count('files_rewritten')
+            if manifest is not None:
+                manifest.record(filepath, new_content)
             return True
         
         return False
@@ -93,61 +142,126 @@ def fix_day_counter_in_file(filepath, correct_day_counter):
         print(f"Error fixing file {filepath}: {e}")
         return False
 
-def validate_and_fix_day_counters():
-    """Validate and fix day counters in all summary files"""
-    start_date_str = get_current_start_date()
+def check_file(filepath, start_date_str, manifest, header_only=False):
+    """Check (and fix) the day counter of a single file
     
-    if not start_date_str:
-        print("No START_DATE configured. Skipping day counter validation.")
-        return
+    Returns None for files that are not summaries, otherwise a dict with
+    the file, date, current and expected counter, whether it was fixed and
+    an error message if the file could not be read.
+    """
+    date_str = extract_date_from_filename(filepath)
+    if not date_str:
+        return None
     
-    print(f"Validating day counters with START_DATE: {start_date_str}")
+    # Calculate correct day counter
+    correct_day_counter = calculate_correct_day_counter(date_str, start_date_str)
     
-    # Get all summary files
-    summary_files = glob.glob('Summary/*.md')
-    if not summary_files:
-        print("No summary files found.")
-        return
+    # Determine what the correct day counter should be
+    expected_day_counter = correct_day_counter.replace(" [Day ", "").replace("]", "") if correct_day_counter else "None"
+    
+    result = {
+        'file': filepath,
+        'date': date_str,
+        'current': None,
+        'expected': expected_day_counter,
+        'fixed': False,
+        'error': None
+    }
+    
+    # Look up the current day counter, reading the file only if it changed
+    content = None
+    current_day_counter = None
+    try:
+        st = os.stat(filepath)
+        entry = manifest.lookup(filepath, st)
+        if entry is None and header_only:
+            current_day_counter = read_header_day_counter(filepath)
+        if entry is None and current_day_counter is None:
+            content, data = read_text(filepath)
+            entry = manifest.record(filepath, content, data, st)
+    except Exception as e:
+        result['error'] = f"Error reading {filepath}: {e}"
+        return result
+    
+    if current_day_counter is None:
+        current_day_counter = entry['day_counter']
+    result['current'] = current_day_counter
     
+    if current_day_counter != expected_day_counter:
+        # Fix the file
+        result['fixed'] = fix_day_counter_in_file(filepath, correct_day_counter, content, manifest)
+    
+    return result
+
+def check_and_fix_files(summary_files, start_date_str, manifest, header_only=False, jobs=1):
+    """Check the day counter of each file and fix the wrong ones
+    
+    Each file is read at most once: unchanged files are answered from the
+    manifest, and the content read for the check is reused for the fix.
+    With header_only, changed files are checked by reading only their first
+    line (the manifest is then refreshed lazily by update_readme.py).
+    With jobs > 1 files are processed by a thread pool; results are always
+    reported in sorted file order.
+    Returns (issues_found, fixed_files).
+    """
     fixed_files = []
     issues_found = []
     
-    for filepath in summary_files:
-        date_str = extract_date_from_filename(filepath)
-        if not date_str:
+    def check(filepath):
+        return check_file(filepath, start_date_str, manifest, header_only)
+    
+    summary_files = sorted(summary_files, key=os.path.basename)
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(check, summary_files))
+    else:
+        results = [check(filepath) for filepath in summary_files]
+    
+    for result in results:
+        if result is None:
             continue
-        
-        # Calculate correct day counter
-        correct_day_counter = calculate_correct_day_counter(date_str, start_date_str)
-        
-        # Read current file content
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error reading {filepath}: {e}")
+        if result['error']:
+            print(result['error'])
+            continue
+        if result['current'] == result['expected']:
             continue
         
-        # Extract current day counter
-        current_day_counter = extract_current_day_counter(content)
-        
-        # Determine what the correct day counter should be
-        expected_day_counter = correct_day_counter.replace(" [Day ", "").replace("]", "") if correct_day_counter else "None"
-        
-        if current_day_counter != expected_day_counter:
-            issues_found.append({
-                'file': filepath,
-                'date': date_str,
-                'current': current_day_counter,
-                'expected': expected_day_counter
-            })
-            
-            # Fix the file
-            if fix_day_counter_in_file(filepath, correct_day_counter):
-                fixed_files.append(filepath)
-                print(f"✅ Fixed {filepath}: Day {current_day_counter} → Day {expected_day_counter}")
+        issues_found.append(result)
+        if result['fixed']:
+            fixed_files.append(result['file'])
+            print(f"✅ Fixed {result['file']}: Day {result['current']} → Day {result['expected']}")
     
-    # Summary
+    return issues_found, fixed_files
+
+def write_json_report(json_path, start_date_str, files_checked, issues_found, fixed_files, success, skipped=None):
+    """Write a machine-readable summary of the validation ('-' for stdout)
+
+    skipped is the reason when nothing was checked ('no_start_date',
+    'no_summary_files' or 'no_changed_files'), else None.
+    """
+    report = {
+        'start_date': start_date_str,
+        'skipped': skipped,
+        'files_checked': files_checked,
+        'issues_found': len(issues_found),
+        'files_fixed': len(fixed_files),
+        'success': success,
+        'issues': [
+            {key: issue[key] for key in ('file', 'date', 'current', 'expected', 'fixed')}
+            for issue in issues_found
+        ]
+    }
+    text = json.dumps(report, indent=2) + '\n'
+    if json_path == '-':
+        # The real stdout: the progress messages are redirected (see report_output)
+        sys.__stdout__.write(text)
+        sys.__stdout__.flush()
+    else:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+def report_day_counter_results(issues_found, fixed_files):
+    """Print the validation summary and return whether it succeeded"""
     if issues_found:
         print(f"\n📊 Summary:")
         print(f"   - Files with incorrect day counters: {len(issues_found)}")
@@ -165,14 +279,111 @@ def validate_and_fix_day_counters():
         print(f"\n✅ All day counters are correct!")
         return True
 
+def validate_and_fix_day_counters(summary_files=None, start_date_str=None, manifest=None, header_only=False,
+                                  jobs=1, json_path=None, incremental=False):
+    """Validate and fix day counters in all summary files
+    
+    With incremental=True, summary_files only holds the files changed since
+    the last run (see git_changes.py) and may be empty. The JSON report is
+    written on every path, also when nothing is checked.
+    """
+    def skip(message, reason, result=None):
+        print(message)
+        if json_path:
+            write_json_report(json_path, start_date_str, 0, [], [], bool(result), reason)
+        return result
+    
+    if virtual_day_counters():
+        # Counters are computed when rendering: no summary should store one,
+        # so changing START_DATE never rewrites the archive
+        start_date_str = None
+        print('Day counters are virtual (DAY_COUNTER_MODE = "virtual"): checking that no summary stores one')
+    else:
+        if start_date_str is None:
+            start_date_str = get_setting('START_DATE')
+        
+        if not start_date_str:
+            return skip("No START_DATE configured. Skipping day counter validation.", 'no_start_date')
+        
+        print(f"Validating day counters with START_DATE: {start_date_str}")
+    
+    # Get all summary files
+    if summary_files is None:
+        summary_files = SummaryStore().list_files()
+    if incremental and not summary_files:
+        return skip("No changed summary files to check.", 'no_changed_files', True)
+    if not summary_files:
+        return skip("No summary files found.", 'no_summary_files')
+    
+    if manifest is None:
+        manifest = SummaryManifest()
+    
+    issues_found, fixed_files = check_and_fix_files(summary_files, start_date_str, manifest, header_only, jobs)
+    
+    if not incremental:
+        manifest.prune(summary_files)
+    manifest.save()
+    
+    # Summary
+    success = report_day_counter_results(issues_found, fixed_files)
+    if json_path:
+        write_json_report(json_path, start_date_str, len(summary_files), issues_found, fixed_files, success)
+    return success
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Validate and fix day counters in summary files')
+    parser.add_argument('--header-only', action='store_true',
+                        help='Check and rewrite only the title line of changed files (fast re-basing)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of files to check in parallel (default: 1)')
+    parser.add_argument('--json', metavar='PATH', dest='json_path',
+                        help="Write a JSON summary of issues found and fixed to PATH ('-' for stdout, "
+                             "with the progress messages on stderr)")
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    add_change_arguments(parser, incremental=True)
+    return parser.parse_args(argv)
+
+def report_output(args):
+    """Context that sends the progress messages to stderr with --json -
+
+    stdout then only carries the JSON report, so it can be piped (e.g. to jq).
+    """
+    if args.json_path == '-':
+        return contextlib.redirect_stdout(sys.stderr)
+    return contextlib.nullcontext()
+
+def run_with_args(args):
+    """Run the validation with the options returned by parse_args()"""
+    summary_files = None
+    manifest = SummaryManifest()
+    changes = changes_from_args(args, manifest)
+    if changes is not None:
+        # Only the summaries touched in the commit range are checked. The
+        # file list is left to the README run, which has to see the same
+        # range to update the archive pages of these months
+        for filepath in changes.changed + changes.deleted:
+            manifest.forget(filepath)
+        summary_files = changes.changed
+    
+    return validate_and_fix_day_counters(summary_files, manifest=manifest, header_only=args.header_only,
+                                         jobs=args.jobs, json_path=args.json_path,
+                                         incremental=changes is not None)
+
 def main():
     """Main function"""
-    try:
-        success = validate_and_fix_day_counters()
-        sys.exit(0 if success else 1)
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+    args = parse_args()
+    setup_profiling('fix_day_counters', args.profile)
+    with report_output(args):
+        try:
+            success = run_with_args(args)
+        except Exception as e:
+            print(f"Error: {e}")
+            success = False
+    sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
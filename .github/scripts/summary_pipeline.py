@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Single-pass pipeline used by the GitHub workflow
+Scans the Summary directory once, fixes day counters and regenerates
+README.md in one process, sharing the file list and the manifest between
+the two steps. Output matches running fix_day_counters.py followed by
+update_readme.py.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from fix_day_counters import validate_and_fix_day_counters
+from git_changes import add_change_arguments, changes_from_args
+from archive_pages import report_archive, update_archive
+from update_readme import changed_paths, generate_readme_content, write_readme
+from summary_calendar import PresenceCalendar
+from summary_config import get_setting
+from summary_manifest import SummaryManifest
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+
+def run_pipeline(changes=None, manifest=None, updated=None):
+    """Fix day counters and update README and archive pages in a single scan
+    
+    With a git_changes.ChangeSet only the changed summaries are checked and
+    the README file list is taken from the manifest, so no scan is needed.
+    A long-running caller can pass its own manifest to keep it in memory.
+    updated overrides the README "Last updated" text.
+    """
+    if manifest is None:
+        manifest = SummaryManifest()
+    summary_files = None
+    if changes is not None:
+        summary_files = manifest.apply_changes(changes)
+        if summary_files is None:
+            print("No complete manifest yet: full rebuild.")
+            changes = None
+
+    if changes is None:
+        summary_files = SummaryStore().list_files(sort=False)
+
+    # Step 1: day counters (reads each stale file at most once)
+    if changes is not None:
+        counters_ok = validate_and_fix_day_counters(changes.changed, manifest=manifest, incremental=True)
+    else:
+        counters_ok = validate_and_fix_day_counters(summary_files, manifest=manifest)
+
+    # Step 2: README and archive pages, reusing the file list and the parsed entries
+    try:
+        with PROFILER.phase('render'):
+            calendar = PresenceCalendar.from_files(summary_files, manifest)
+            new_content = generate_readme_content(summary_files, manifest, updated, calendar)
+
+        write_readme(new_content)
+        report_archive(update_archive(summary_files, manifest, get_setting('START_DATE'),
+                                      changed_paths(changes), calendar))
+        # Only now: a failed run must diff from the same commit next time
+        manifest.set_revision(changes)
+        manifest.save()
+    except Exception as e:
+        print(f"Error updating README: {e}")
+        return False
+
+    # A missing START_DATE only skips the counter step
+    return counters_ok is not False
+
+def main():
+    """Main function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fix day counters and update README.md in one pass')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    parser.add_argument('--timestamp', help='"Last updated" text for the README footer (default: date of the newest summary)')
+    add_change_arguments(parser, incremental=True)
+    args = parser.parse_args()
+    setup_profiling('summary_pipeline', args.profile)
+
+    try:
+        manifest = SummaryManifest()
+        success = run_pipeline(changes_from_args(args, manifest), manifest, args.timestamp)
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
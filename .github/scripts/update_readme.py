@@ -3,39 +3,48 @@
 Script to update README.md with links to daily summary files
 """
 
+import heapq
 import os
-import glob
-from datetime import datetime, timedelta
-import re
+from collections import deque
+from datetime import datetime
+import sys
 
-def get_summary_files():
-    """Get all summary files from the Summary directory"""
-    summary_files = glob.glob('Summary/*.md')
-    # Sort files by date (newest first)
-    summary_files.sort(reverse=True)
-    return summary_files
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(REPO_ROOT)
+from date_gaps import day_number, format_range
+from git_changes import add_change_arguments, changes_from_args
+from summary_io import write_if_changed
+from summary_calendar import PresenceCalendar
+from summary_config import get_setting
+from summary_manifest import SummaryManifest
+from summary_parser import extract_date_from_filename
+from summary_profile import PROFILER, setup_profiling
+from summary_stats import RollupStats
+from summary_storage import SummaryStore
 
-def extract_date_from_filename(filename):
-    """Extract date from filename (e.g., 'Summary/2024-01-15.md' -> '2024-01-15')"""
-    basename = os.path.basename(filename)
-    date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.md$', basename)
-    return date_match.group(1) if date_match else None
+HEATMAP_PATH = 'Archive/heatmap.svg'
+
+# Summaries listed under "Recent Summaries" unless RECENT_SUMMARIES is set in config.py
+DEFAULT_RECENT_SUMMARIES = 10
+# Missing ranges shown at each end of a long "Recent Missing Summaries" list
+MISSING_RANGES_SHOWN = 5
+
+# Fill state (see template_engine.TemplateFingerprint) -> README icon
+STATUS_ICONS = {'untouched': "📄", 'partial': "✏️", 'filled': "📝"}
+
+def get_recent_count():
+    """Number of summaries listed under "Recent Summaries" (RECENT_SUMMARIES)"""
+    value = get_setting('RECENT_SUMMARIES', DEFAULT_RECENT_SUMMARIES)
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        print(f"Warning: Invalid RECENT_SUMMARIES value {value!r}, using {DEFAULT_RECENT_SUMMARIES}.")
+        return DEFAULT_RECENT_SUMMARIES
 
 def calculate_day_counter(date_str, start_date_str=None):
     """Calculate day counter for a given date"""
-    if not start_date_str:
-        return ""
-    
-    try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        days_diff = (date_obj - start_date).days
-        if days_diff >= 0:
-            return f" [Day {days_diff + 1}]"
-    except ValueError:
-        pass
-    
-    return ""
+    number = day_number(date_str, start_date_str)
+    return f" [Day {number}]" if number else ""
 
 def format_date_for_display(date_str):
     """Format date for display (e.g., '2024-01-15' -> 'January 15, 2024')"""
@@ -45,83 +54,128 @@ def format_date_for_display(date_str):
     except ValueError:
         return date_str
 
-def get_file_stats(filename):
+def get_file_stats(filename, manifest=None):
     """Get basic stats about the summary file"""
+    if manifest is None:
+        manifest = SummaryManifest()
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Count lines
-        lines = content.split('\n')
-        line_count = len(lines)
-        
-        # Count words
-        word_count = len(content.split())
-        
-        # Check if file has content (not just template)
-        has_content = any(line.strip() and not line.strip().startswith('- [ ]') 
-                         for line in lines if line.strip())
+        entry = manifest.get(filename)
+        if entry is None:
+            raise OSError(filename)
         
         return {
-            'line_count': line_count,
-            'word_count': word_count,
-            'has_content': has_content
+            'line_count': entry['line_count'],
+            'word_count': entry['word_count'],
+            'status': entry['status'],
+            'has_content': entry['has_content']
         }
     except Exception:
-        return {'line_count': 0, 'word_count': 0, 'has_content': False}
+        return {'line_count': 0, 'word_count': 0, 'status': 'untouched', 'has_content': False}
 
-def generate_missing_summaries_section(summary_files):
-    """Generate the missing summaries section"""
-    if not summary_files:
-        return ""
+def format_summary_entry(filename, start_date_str, manifest, link=None):
+    """Format one summary as a README list item (None if not a summary file)"""
+    date_str = extract_date_from_filename(filename)
+    if not date_str:
+        return None
+    display_date = format_date_for_display(date_str)
+    day_counter = calculate_day_counter(date_str, start_date_str)
+    stats = get_file_stats(filename, manifest)
+    
+    # Create status indicator
+    status = STATUS_ICONS.get(stats['status'], "📝")
+    
+    entry = f"- {status} [{display_date}{day_counter}]({link or filename})"
+    
+    # Add stats if file has content
+    if stats['has_content']:
+        entry += f" ({stats['word_count']} words)"
     
-    # Extract all dates from existing files
-    existing_dates = set()
+    return entry
+
+def generate_archive_section(summary_files):
+    """Generate links to the per-year archive pages (see archive_pages.py)"""
+    years = {}
     for filename in summary_files:
         date_str = extract_date_from_filename(filename)
         if date_str:
-            existing_dates.add(date_str)
-    
-    if not existing_dates:
+            years[date_str[:4]] = years.get(date_str[:4], 0) + 1
+    if not years:
         return ""
     
-    # Try to get start date from config
-    start_date_str = None
-    try:
-        import sys
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        from config import START_DATE
-        start_date_str = START_DATE
-    except ImportError:
-        pass
-    
-    # Find the date range
-    sorted_dates = sorted(existing_dates)
-    range_start_date = datetime.strptime(sorted_dates[0], '%Y-%m-%d')
-    end_date = datetime.strptime(sorted_dates[-1], '%Y-%m-%d')
+    content = "\n## Archive\n\n"
+    for year, count in sorted(years.items(), reverse=True):
+        content += f"- [{year}](Archive/{year}.md) ({count} summaries)\n"
+    return content
+
+def calendar_range(calendar):
+    """First and last day covered by the README: START_DATE (if earlier) to the newest summary"""
+    if calendar.first is None:
+        return None, None
+    range_start = calendar.first
     
-    # If we have a configured start date, use it as the range start
+    # If we have a configured start date, use the earlier of it and the first summary
+    start_date_str = get_setting('START_DATE')
     if start_date_str:
         try:
-            config_start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            # Use the earlier of config start date or first summary date
-            start_date = min(config_start_date, range_start_date)
+            range_start = min(datetime.strptime(start_date_str, '%Y-%m-%d').date(), range_start)
         except ValueError:
-            start_date = range_start_date
-    else:
-        start_date = range_start_date
+            pass
+    return range_start, calendar.last
+
+def generate_calendar_section(calendar):
+    """Generate the heatmap and coverage/streak line (see summary_calendar.py)"""
+    range_start, range_end = calendar_range(calendar)
+    if range_start is None:
+        return ""
+    
+    present, total = calendar.coverage(range_start, range_end)
+    longest, latest = calendar.streaks(range_start, range_end)
+    content = "\n## Calendar\n\n"
+    content += f"![Summary calendar]({HEATMAP_PATH})\n\n"
+    content += (f"Coverage: {present}/{total} days ({present / total:.0%}) · "
+                f"latest streak: {latest} days · longest streak: {longest} days\n")
+    return content
+
+def generate_stats_section(stats):
+    """Generate the rollup table: latest week and month, then every year"""
+    rows = [(f"Week {key}", row) for key, row in stats.rows('week', 1)]
+    rows += [(format_date_for_display(f"{key}-01").replace(' 01,', ''), row) for key, row in stats.rows('month', 1)]
+    rows += [(key, row) for key, row in reversed(stats.rows('year'))]
+    if not rows:
+        return ""
+    
+    content = "\n## Statistics\n\n"
+    content += "| Period | Summaries | Filled days | Words | Tasks done | Longest streak |\n"
+    content += "|---|---:|---:|---:|---:|---:|\n"
+    for label, row in rows:
+        content += (f"| {label} | {row['summaries']} | {row['filled_days']} | {row['words']} | "
+                    f"{row['tasks_done']} | {row['longest_streak']} |\n")
+    return content
+
+def generate_missing_summaries_section(summary_files, calendar=None):
+    """Generate the missing summaries section"""
+    if not summary_files:
+        return ""
     
-    # Generate all expected dates in the range
-    expected_dates = set()
-    current_date = start_date
-    while current_date <= end_date:
-        expected_dates.add(current_date.strftime('%Y-%m-%d'))
-        current_date = current_date + timedelta(days=1)
+    if calendar is None:
+        calendar = PresenceCalendar.from_files(summary_files)
+    range_start, range_end = calendar_range(calendar)
+    if range_start is None:
+        return ""
     
-    # Find missing dates
-    missing_dates = sorted(expected_dates - existing_dates)
+    # Stream the runs of empty days in the calendar, keeping only the first
+    # and last few ranges and running totals
+    first_ranges = []
+    last_ranges = deque(maxlen=MISSING_RANGES_SHOWN)
+    range_count = total_missing = 0
+    for missing_range in calendar.missing_ranges(range_start, range_end):
+        if len(first_ranges) < MISSING_RANGES_SHOWN:
+            first_ranges.append(missing_range)
+        last_ranges.append(missing_range)
+        range_count += 1
+        total_missing += missing_range[2]
     
-    if not missing_dates:
+    if not range_count:
         return ""
     
     # Generate the section content
@@ -130,46 +184,64 @@ def generate_missing_summaries_section(summary_files):
     content += "The following dates are missing from your daily summaries:\n\n"
     content += "```\n"
     
-    # Group missing dates for better readability
-    if len(missing_dates) <= 10:
-        content += "\n".join(missing_dates)
+    # Group missing ranges for better readability
+    if range_count <= 2 * MISSING_RANGES_SHOWN:
+        # Every range is in first_ranges or last_ranges
+        extra = range_count - len(first_ranges)
+        shown = first_ranges + (list(last_ranges)[-extra:] if extra else [])
+        content += "\n".join(format_range(*missing_range) for missing_range in shown)
     else:
         # Show first 5 and last 5 with ellipsis
-        content += "\n".join(missing_dates[:5])
+        content += "\n".join(format_range(*missing_range) for missing_range in first_ranges)
         content += "\n...\n"
-        content += "\n".join(missing_dates[-5:])
-        content += f"\n\nTotal missing: {len(missing_dates)} dates"
+        content += "\n".join(format_range(*missing_range) for missing_range in last_ranges)
+    content += f"\n\nTotal missing: {total_missing} dates in {range_count} ranges"
     
     content += "\n```\n\n"
     content += "To create missing summaries, use:\n"
     content += "```bash\n"
     content += "# For a single date\n"
     content += "python3 create_daily_summary.py YYYY-MM-DD\n\n"
-    content += "# For multiple dates (example)\n"
-    for date in missing_dates[-3:]:  # Show first 3 as examples
-        content += f"python3 create_daily_summary.py {date}\n"
-    if len(missing_dates) > 3:
-        content += "# ... and so on for other missing dates\n"
+    content += "# For a range of dates (example)\n"
+    for start, end, _count in list(last_ranges)[-3:]:  # Show last 3 ranges as examples
+        content += f"python3 create_missing_summaries.py {start.isoformat()} {end.isoformat()} --yes\n"
+    if range_count > 3:
+        content += "# ... and so on for other missing ranges\n"
     content += "```\n\n"
     content += "</details>\n\n"
     
     return content
 
-def generate_readme_content():
-    """Generate the complete README content"""
+def changed_paths(changes):
+    """Changed and deleted summaries of a git_changes.ChangeSet (None for a full run)"""
+    if changes is None:
+        return None
+    return changes.changed + changes.deleted
+
+def readme_timestamp(summary_files):
+    """Date of the newest summary, used as the README timestamp"""
+    dates = [date_str for date_str in map(extract_date_from_filename, summary_files) if date_str]
+    return max(dates) if dates else "never"
+
+def write_readme(content, path='README.md'):
+    """Write the README only if its content changed; returns True if written"""
+    if write_if_changed(path, content):
+        print(f"Successfully updated {path}")
+        return True
+    print(f"{path} is already up to date")
+    return False
+
+def generate_readme_content(summary_files=None, manifest=None, updated=None, calendar=None):
+    """Generate the complete README content
     
-    # Try to get start date from environment, config file, or use default
-    start_date_str = os.environ.get('START_DATE')
+    summary_files and manifest may be passed in by a caller that has already
+    scanned the Summary directory (see summary_pipeline.py), and so may the
+    PresenceCalendar built from them. The output only
+    depends on the summaries: the "Last updated" footer is the date of the
+    newest summary unless an explicit updated value is given.
+    """
     
-    if not start_date_str:
-        # Try to import from config file
-        try:
-            import sys
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-            from config import START_DATE
-            start_date_str = START_DATE
-        except ImportError:
-            start_date_str = None
+    start_date_str = get_setting('START_DATE')
     
     # Header
     content = """# PhD Daily Summary
@@ -180,39 +252,44 @@ This repository contains my daily summaries during my PhD journey. Each day, I d
 
 """
     
-    # Get summary files
-    summary_files = get_summary_files()
+    # Get summary files (in any order)
+    if summary_files is None:
+        summary_files = SummaryStore().list_files(sort=False)
+    if manifest is None:
+        manifest = SummaryManifest()
     
     if not summary_files:
         content += "No daily summaries found yet.\n\n"
     else:
-        # Add links to recent summaries
-        for filename in summary_files[:10]:  # Show last 10 summaries
-            date_str = extract_date_from_filename(filename)
-            if date_str:
-                display_date = format_date_for_display(date_str)
-                day_counter = calculate_day_counter(date_str, start_date_str)
-                stats = get_file_stats(filename)
-                
-                # Create status indicator
-                if stats['has_content']:
-                    status = "📝"
-                else:
-                    status = "📄"
-                
-                content += f"- {status} [{display_date}{day_counter}]({filename})"
-                
-                # Add stats if file has content
-                if stats['has_content']:
-                    content += f" ({stats['word_count']} words)"
-                
-                content += "\n"
+        # Add links to the most recent summaries, picked with a bounded heap
+        # instead of sorting the whole archive
+        recent_count = get_recent_count()
+        for filename in heapq.nlargest(recent_count, summary_files, key=os.path.basename):
+            entry = format_summary_entry(filename, start_date_str, manifest)
+            if entry:
+                content += entry + "\n"
         
-        if len(summary_files) > 10:
-            content += f"\n... and {len(summary_files) - 10} more summaries\n"
+        if len(summary_files) > recent_count:
+            content += f"\n... and {len(summary_files) - recent_count} more summaries in the [archive](#archive)\n"
     
-    # Add missing summaries section
-    content += generate_missing_summaries_section(summary_files)
+    if calendar is None:
+        calendar = PresenceCalendar.from_files(summary_files, manifest)
+    stats = RollupStats()
+    stats.update(summary_files, manifest)
+    stats.save()
+    
+    # Drop entries for deleted summaries and persist what was parsed
+    manifest.prune(summary_files)
+    manifest.save()
+    
+    # Add calendar, statistics, archive and missing summaries sections
+    content += generate_calendar_section(calendar)
+    content += generate_stats_section(stats)
+    content += generate_archive_section(summary_files)
+    content += generate_missing_summaries_section(summary_files, calendar)
+    
+    if updated is None:
+        updated = readme_timestamp(summary_files)
     
     # Add footer
     content += """
@@ -235,22 +312,48 @@ Each daily summary includes:
 - Other records
 
 ---
-*Last updated: {datetime}*
-""".format(datetime=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+*Last updated: {updated}*
+""".format(updated=updated)
     
     return content
 
 def main():
     """Main function to update README"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Update README.md with links to daily summaries')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    parser.add_argument('--timestamp', help='"Last updated" text for the footer (default: date of the newest summary)')
+    add_change_arguments(parser, incremental=True)
+    args = parser.parse_args()
+    setup_profiling('update_readme', args.profile)
+    
     try:
+        # In incremental mode the file list comes from the manifest instead of a scan
+        summary_files = None
+        manifest = SummaryManifest()
+        changes = changes_from_args(args, manifest)
+        if changes is not None:
+            summary_files = manifest.apply_changes(changes)
+        if summary_files is None:
+            summary_files = SummaryStore().list_files(sort=False)
+            changes = None
+        
         # Generate new content
-        new_content = generate_readme_content()
+        with PROFILER.phase('render'):
+            calendar = PresenceCalendar.from_files(summary_files, manifest)
+            new_content = generate_readme_content(summary_files, manifest, args.timestamp, calendar)
         
-        # Write to README.md
-        with open('README.md', 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        # Write to README.md (only if something changed)
+        write_readme(new_content)
         
-        print("Successfully updated README.md")
+        # Archive pages of the months that changed, and the heatmap
+        from archive_pages import update_archive, report_archive
+        report_archive(update_archive(summary_files, manifest, get_setting('START_DATE'),
+                                      changed_paths(changes), calendar))
+        manifest.set_revision(changes)
+        manifest.save()
         
     except Exception as e:
         print(f"Error updating README: {e}")
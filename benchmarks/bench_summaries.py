@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Benchmark the summary scripts on synthetic Summary/ trees
+Usage: python benchmarks/bench_summaries.py [--sizes 1000 10000] [--output results.json]
+
+For every corpus size a synthetic repository is generated in a temporary
+directory and each benchmark runs in a fresh Python process, so wall time
+and peak RSS are measured per benchmark. Results are written as JSON and can
+be compared with a previous run using --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+from summary_storage import LAYOUTS, SummaryStore
+
+RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+
+BENCHMARKS = [
+    'create_daily_summary',
+    'get_missing_dates',
+    'validate_and_fix_day_counters',
+    'generate_readme_content'
+]
+
+WORDS = ("model training loss dataset paper reviewer experiment baseline CUDA OOM "
+         "gradient ablation figure draft meeting advisor seminar proof lemma "
+         "benchmark results deadline rebuttal citation kernel cluster job").split()
+
+# Corpus START_DATE and the shifted value used to force counter fixes
+CORPUS_START_DATE = date(2020, 1, 1)
+SHIFTED_START_DATE = date(2019, 12, 1)
+
+def random_sentence(rng, low=4, high=14):
+    """Return a random sentence built from WORDS"""
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+def render_filled_summary(rng, day, day_number):
+    """Render a summary whose sections have been filled in"""
+    def items(count):
+        return '\n'.join(f"- [{'x' if rng.random() < 0.6 else ' '}] {random_sentence(rng)}"
+                         for _ in range(count))
+
+    def paragraph():
+        return '\n'.join(random_sentence(rng, 8, 20) for _ in range(rng.randint(0, 3)))
+
+    return (f"# Daily Summary - {day.isoformat()} [Day {day_number}]\n\n"
+            f"## Today's Completed Work\n\n{items(rng.randint(1, 6))}\n\n"
+            f"## Issues Encountered\n\n{paragraph()}\n\n"
+            f"## Solutions\n\n{paragraph()}\n\n"
+            f"## Tomorrow's Plan\n\n{items(rng.randint(1, 4))}\n\n"
+            f"## Study Notes\n\n{paragraph()}\n\n"
+            f"## Other Records\n\n\n---\n"
+            f"*Created at: {day.isoformat()} 09:00:00* ")
+
+def generate_corpus(root, size, seed=0, fill_ratio=0.7, layout='flat'):
+    """Generate a synthetic repository with `size` summary files
+
+    Days are skipped at random (and occasionally in multi-week runs) so the
+    archive has realistic gaps; roughly fill_ratio of the files have been
+    filled in, the rest are untouched template renders. layout is a
+    summary_storage layout ('flat' or 'sharded').
+    """
+    rng = random.Random(seed)
+    store = SummaryStore(root, layout)
+    os.makedirs(store.summary_dir)
+    shutil.copy(os.path.join(REPO_ROOT, 'template.md'), root)
+    with open(os.path.join(REPO_ROOT, 'template.md'), 'r', encoding='utf-8') as f:
+        template = f.read()
+
+    day = CORPUS_START_DATE
+    created = 0
+    while created < size:
+        roll = rng.random()
+        if roll < 0.01:
+            day += timedelta(days=rng.randint(7, 30))   # holidays, conferences
+        elif roll < 0.15:
+            day += timedelta(days=1)                    # a single missed day
+        day_number = (day - CORPUS_START_DATE).days + 1
+        if rng.random() < fill_ratio:
+            content = render_filled_summary(rng, day, day_number)
+        else:
+            content = (template.replace('{{DATE}}', day.isoformat())
+                       .replace('{{DATETIME}}', f'{day.isoformat()} 00:00:00')
+                       .replace('{{DAY_COUNTER}}', f' [Day {day_number}]'))
+        path = store.path_for(day.isoformat())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        created += 1
+        day += timedelta(days=1)
+
+    write_config(root, CORPUS_START_DATE, layout)
+    return day
+
+def write_config(root, start_date, layout='flat'):
+    """Write the corpus config.py"""
+    with open(os.path.join(root, 'config.py'), 'w', encoding='utf-8') as f:
+        f.write(f'START_DATE = "{start_date.isoformat()}"\n')
+        f.write(f'SUMMARY_LAYOUT = "{layout}"\n')
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def run_worker(name, corpus, count):
+    """Run one benchmark inside the corpus directory and print a JSON result"""
+    os.chdir(corpus)
+    sys.path[:0] = [corpus, REPO_ROOT, os.path.join(REPO_ROOT, '.github', 'scripts')]
+
+    devnull = open(os.devnull, 'w')
+    real_stdout, sys.stdout = sys.stdout, devnull
+    try:
+        if name == 'create_daily_summary':
+            from create_daily_summary import create_daily_summary
+            last = os.path.basename(SummaryStore().list_files()[-1])[:10]
+            first_new = datetime.strptime(last, '%Y-%m-%d') + timedelta(days=1)
+            files = max(1, count // 10)
+            dates = [(first_new + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(files)]
+            started = time.perf_counter()
+            for date_str in dates:
+                create_daily_summary(date_str)
+        elif name == 'get_missing_dates':
+            from create_missing_summaries import get_missing_dates
+            files = count
+            started = time.perf_counter()
+            get_missing_dates()
+        elif name == 'validate_and_fix_day_counters':
+            from fix_day_counters import validate_and_fix_day_counters
+            # Re-base every file, the worst case after editing START_DATE
+            write_config(corpus, SHIFTED_START_DATE, SummaryStore().layout)
+            files = count
+            started = time.perf_counter()
+            validate_and_fix_day_counters()
+        elif name == 'generate_readme_content':
+            from update_readme import generate_readme_content
+            files = count
+            started = time.perf_counter()
+            generate_readme_content()
+        else:
+            raise ValueError(f'Unknown benchmark: {name}')
+        elapsed = time.perf_counter() - started
+    finally:
+        sys.stdout = real_stdout
+        devnull.close()
+
+    print(json.dumps({
+        'wall_time_s': elapsed,
+        'files': files,
+        'files_per_s': files / elapsed if elapsed > 0 else None,
+        'peak_rss_mb': peak_rss_mb()
+    }))
+
+def run_benchmark(name, size, seed, layout='flat'):
+    """Generate a fresh corpus and time one benchmark in a subprocess"""
+    corpus = tempfile.mkdtemp(prefix=f'summary-bench-{size}-')
+    try:
+        generate_corpus(corpus, size, seed, layout=layout)
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker', name, corpus, str(size)],
+            capture_output=True, text=True, check=True
+        )
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+    finally:
+        shutil.rmtree(corpus, ignore_errors=True)
+
+def git_revision():
+    """Current git revision of the repository, if available"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(previous_path, results):
+    """Print the change in wall time against a previous results file"""
+    with open(previous_path, 'r', encoding='utf-8') as f:
+        previous = json.load(f)
+    old = {(r['benchmark'], r['size']): r for r in previous['results']}
+    print(f"\nComparison with {previous_path} ({previous.get('revision')}):")
+    for result in results:
+        before = old.get((result['benchmark'], result['size']))
+        if not before:
+            continue
+        ratio = result['wall_time_s'] / before['wall_time_s'] if before['wall_time_s'] else float('inf')
+        print(f"  {result['benchmark']:<32} {result['size']:>7}  {ratio:6.2f}x")
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        run_worker(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    parser = argparse.ArgumentParser(description='Benchmark the summary scripts on synthetic archives')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='Number of summary files per corpus (default: 1000 10000)')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, help='Run only these benchmarks')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for corpus generation')
+    parser.add_argument('--layout', choices=LAYOUTS, default='flat', help='Summary directory layout (default: flat)')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', metavar='PATH', help='Compare against a previous results file')
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'benchmark':<32} {'files':>7} {'wall (s)':>10} {'files/s':>10} {'peak RSS (MiB)':>15}")
+    for size in args.sizes:
+        for name in args.only or BENCHMARKS:
+            result = run_benchmark(name, size, args.seed, args.layout)
+            result.update({'benchmark': name, 'size': size})
+            results.append(result)
+            print(f"{name:<32} {size:>7} {result['wall_time_s']:>10.3f} "
+                  f"{result['files_per_s'] or 0:>10.0f} {result['peak_rss_mb']:>15.1f}")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'layout': args.layout,
+            'results': results
+        }, f, indent=2)
+        f.write('\n')
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+if __name__ == '__main__':
+    main()
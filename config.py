@@ -3,4 +3,22 @@
 # Format: YYYY-MM-DD
 
 START_DATE = "2025-07-01"  # Change this to your actual start date
-# START_DATE = None  # Uncomment this line if you don't want day counting 
\ No newline at end of file
+# START_DATE = None  # Uncomment this line if you don't want day counting
+
+# Optional deadline used by the {{DAYS_TO_DEADLINE}} template variable
+# DEADLINE = "2029-06-30"
+
+# Layout of the Summary directory: "flat" (Summary/2025-08-03.md) or
+# "sharded" (Summary/2025/08/2025-08-03.md). Detected automatically if unset;
+# move existing files with: python summary_storage.py migrate --layout sharded
+# SUMMARY_LAYOUT = "sharded"
+
+# Day counters: "stored" writes " [Day N]" into each summary's title (and
+# fix_day_counters.py rewrites them when START_DATE changes); "virtual" keeps
+# only the date in the files and computes the counter when the README,
+# archive pages and exports are rendered, so changing START_DATE rewrites
+# nothing. The next fix_day_counters.py run strips stored counters.
+# DAY_COUNTER_MODE = "virtual"
+
+# Number of summaries listed under "Recent Summaries" in the README (default: 10)
+# RECENT_SUMMARIES = 10
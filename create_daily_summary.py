@@ -9,6 +9,10 @@ import os
 import sys
 from datetime import datetime
 import argparse
+from summary_config import get_setting
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+from template_engine import get_template, parse_start_date, summary_variables
 
 def create_daily_summary(date_str=None, start_date_str=None):
     """Create a daily summary file for the specified date"""
@@ -26,58 +30,46 @@ def create_daily_summary(date_str=None, start_date_str=None):
     
     # Get start date from config if not provided
     if not start_date_str:
-        try:
-            from config import START_DATE
-            start_date_str = START_DATE
-        except ImportError:
-            start_date_str = None
+        start_date_str = get_setting('START_DATE')
     
-    # Calculate day counter if start date is provided
-    day_counter = ""
-    if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            days_diff = (target_date - start_date).days
-            if days_diff >= 0:
-                day_counter = f" [Day {days_diff + 1}]"
-        except ValueError:
-            print(f"Warning: Invalid start date format. Please use YYYY-MM-DD format.")
+    # Parse start date (for the day counter) and optional deadline
+    start_date = parse_start_date(start_date_str)
+    deadline = parse_start_date(get_setting('DEADLINE'), 'deadline')
     
-    # Format date for filename and content
+    # Format date for filename
     date_filename = target_date.strftime('%Y-%m-%d')
-    date_content = target_date.strftime('%Y-%m-%d')
-    datetime_content = target_date.strftime('%Y-%m-%d %H:%M:%S')
     
     # Define file paths
     template_path = 'template.md'
-    output_path = f'Summary/{date_filename}.md'
+    store = SummaryStore()
+    output_path = store.path_for(date_filename)
     
     # Check if template exists
     if not os.path.exists(template_path):
         print(f"Error: Template file '{template_path}' not found.")
         return False
     
-    # Check if output file already exists
-    if os.path.exists(output_path):
-        print(f"Warning: File '{output_path}' already exists. Skipping creation.")
+    # Check if the summary already exists (in either layout)
+    existing_path = store.find(date_filename)
+    if existing_path:
+        print(f"Warning: File '{existing_path}' already exists. Skipping creation.")
         return False
     
-    # Create Summary directory if it doesn't exist
-    os.makedirs('Summary', exist_ok=True)
+    # Create the Summary directory (or month shard) if it doesn't exist
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Read template and replace placeholders
+    # Render the compiled template
     try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Replace placeholders
-        content = content.replace('{{DATE}}', date_content)
-        content = content.replace('{{DATETIME}}', datetime_content)
-        content = content.replace('{{DAY_COUNTER}}', day_counter)
+        template = get_template(template_path)
+        with PROFILER.phase('render'):
+            variables = summary_variables(target_date, start_date, deadline, template.placeholders)
+            content = template.render(variables)
         
         # Write the new file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with PROFILER.phase('write'):
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        PROFILER.count('files_written')
         
         print(f"Successfully created daily summary: {output_path}")
         return True
@@ -90,8 +82,11 @@ def main():
     parser = argparse.ArgumentParser(description='Create daily summary file from template')
     parser.add_argument('date', nargs='?', help='Date in YYYY-MM-DD format (default: today)')
     parser.add_argument('--start-date', help='Start date in YYYY-MM-DD format for day counting')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
     
     args = parser.parse_args()
+    setup_profiling('create_daily_summary', args.profile)
     
     success = create_daily_summary(args.date, args.start_date)
     sys.exit(0 if success else 1)
@@ -7,85 +7,154 @@ If no dates provided, uses the range from existing files
 
 import os
 import sys
-import glob
 from datetime import datetime, timedelta
-import re
-from create_daily_summary import create_daily_summary
+import time
+from concurrent.futures import ThreadPoolExecutor
+from date_gaps import expand_ranges, format_range
+from summary_calendar import PresenceCalendar
+from summary_config import get_setting
+from summary_parser import PLAN_SECTION, extract_section
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+from template_engine import get_template, parse_start_date, summary_variables
 
-def get_existing_dates():
-    """Get all existing summary dates"""
-    summary_files = glob.glob('Summary/*.md')
-    existing_dates = set()
-    
-    for filename in summary_files:
-        basename = os.path.basename(filename)
-        date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.md$', basename)
-        if date_match:
-            existing_dates.add(date_match.group(1))
-    
-    return existing_dates
-
-def get_missing_dates(start_date_str=None, end_date_str=None):
-    """Get missing dates in the specified range"""
-    existing_dates = get_existing_dates()
-    
-    if not existing_dates:
+def get_missing_ranges(start_date_str=None, end_date_str=None):
+    """Get missing (start, end, count) ranges in the specified range"""
+    # One pass over the directory marks a compact per-year calendar and
+    # tracks the first and last date; no set or sorted list of dates is built
+    with PROFILER.phase('scan'):
+        calendar = PresenceCalendar.from_files(SummaryStore().iter_files())
+    
+    if calendar.first is None:
         print("No existing summary files found.")
         return []
     
-    # Determine date range
+    # Determine date range (defaults to the range of existing files)
     if start_date_str and end_date_str:
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+            range_start = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+            range_end = datetime.strptime(end_date_str, '%Y-%m-%d').date()
         except ValueError:
             print("Error: Invalid date format. Please use YYYY-MM-DD format.")
             return []
     else:
-        # Use range from existing files
-        sorted_dates = sorted(existing_dates)
-        start_date = datetime.strptime(sorted_dates[0], '%Y-%m-%d')
-        end_date = datetime.strptime(sorted_dates[-1], '%Y-%m-%d')
-    
-    # Generate all expected dates in the range
-    expected_dates = set()
-    current_date = start_date
-    while current_date <= end_date:
-        expected_dates.add(current_date.strftime('%Y-%m-%d'))
-        current_date = current_date + timedelta(days=1)
-    
-    # Find missing dates
-    missing_dates = sorted(expected_dates - existing_dates)
-    return missing_dates
+        range_start, range_end = calendar.first, calendar.last
+    
+    if range_start > range_end:
+        return []
+    return list(calendar.missing_ranges(range_start, range_end))
+
+def get_missing_dates(start_date_str=None, end_date_str=None):
+    """Get missing dates in the specified range"""
+    return list(expand_ranges(get_missing_ranges(start_date_str, end_date_str)))
+
+def create_summaries_batch(dates, start_date_for_counter=None, jobs=8, template_path='template.md'):
+    """Create summary files for many dates with a single template load
+    
+    The template is compiled once and every date is rendered from the
+    compiled form, in date order: {{PREVIOUS_PLAN}} takes the plan of a day
+    rendered earlier in the batch from memory, since its file may not be
+    written yet. Only the writes run in a bounded thread pool. Files are
+    opened in exclusive-create mode so existing summaries are never
+    overwritten. Returns a list of (date, status) tuples in date order.
+    """
+    if not os.path.exists(template_path):
+        print(f"Error: Template file '{template_path}' not found.")
+        return []
+    
+    template = get_template(template_path)
+    
+    if not start_date_for_counter:
+        start_date_for_counter = get_setting('START_DATE')
+    start_date = parse_start_date(start_date_for_counter)
+    deadline = parse_start_date(get_setting('DEADLINE'), 'deadline')
+    
+    store = SummaryStore()
+    carry_plan = 'PREVIOUS_PLAN' in template.placeholders
+    
+    statuses = {}
+    pending = []
+    # Plans of the summaries rendered in this batch, by date
+    plans = {}
+    for date_str in sorted(set(dates)):
+        try:
+            target_date = datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            statuses[date_str] = 'invalid date'
+            continue
+        if store.find(date_str):
+            statuses[date_str] = 'exists'
+            continue
+        with PROFILER.phase('render'):
+            previous = (target_date - timedelta(days=1)).strftime('%Y-%m-%d')
+            variables = summary_variables(target_date, start_date, deadline, template.placeholders,
+                                          plans.get(previous))
+            content = template.render(variables)
+            if carry_plan:
+                plans[date_str] = extract_section(content, PLAN_SECTION)
+        pending.append((date_str, content))
+    
+    def write_summary(item):
+        date_str, content = item
+        output_path = store.path_for(date_str)
+        try:
+            with PROFILER.phase('write'):
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                with open(output_path, 'x', encoding='utf-8') as f:
+                    f.write(content)
+        except FileExistsError:
+            return date_str, 'exists'
+        except OSError as e:
+            return date_str, f'error: {e}'
+        PROFILER.count('files_written')
+        return date_str, 'created'
+    
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        statuses.update(pool.map(write_summary, pending))
+    return [(date_str, statuses[date_str]) for date_str in dates]
 
-def create_missing_summaries(start_date_str=None, end_date_str=None, start_date_for_counter=None):
+def create_missing_summaries(start_date_str=None, end_date_str=None, start_date_for_counter=None,
+                             assume_yes=False, dry_run=False, jobs=8):
     """Create missing summary files"""
-    missing_dates = get_missing_dates(start_date_str, end_date_str)
+    missing_ranges = get_missing_ranges(start_date_str, end_date_str)
     
-    if not missing_dates:
+    if not missing_ranges:
         print("No missing dates found in the specified range.")
         return
     
-    print(f"Found {len(missing_dates)} missing dates:")
-    for date in missing_dates:
-        print(f"  - {date}")
+    missing_dates = list(expand_ranges(missing_ranges))
+    print(f"Found {len(missing_dates)} missing dates in {len(missing_ranges)} ranges:")
+    for missing_range in missing_ranges:
+        print(f"  - {format_range(*missing_range)}")
     
-    # Ask for confirmation
-    response = input(f"\nCreate {len(missing_dates)} missing summary files? (y/N): ")
-    if response.lower() != 'y':
-        print("Operation cancelled.")
+    if dry_run:
+        print(f"\nDry run: {len(missing_dates)} summary files would be created.")
         return
     
+    # Ask for confirmation
+    if not assume_yes:
+        response = input(f"\nCreate {len(missing_dates)} missing summary files? (y/N): ")
+        if response.lower() != 'y':
+            print("Operation cancelled.")
+            return
+    
     # Create missing summaries
+    started = time.perf_counter()
+    results = create_summaries_batch(missing_dates, start_date_for_counter, jobs)
+    elapsed = time.perf_counter() - started
+    
+    store = SummaryStore()
     created_count = 0
-    for date in missing_dates:
-        print(f"Creating summary for {date}...")
-        if create_daily_summary(date, start_date_for_counter):
+    for date, status in results:
+        if status == 'created':
             created_count += 1
+            print(f"Created {store.path_for(date)}")
         else:
-            print(f"Failed to create summary for {date}")
+            print(f"Failed to create summary for {date} ({status})")
     
+    rate = created_count / elapsed if elapsed > 0 else float(created_count)
     print(f"\n✅ Successfully created {created_count} out of {len(missing_dates)} missing summaries.")
+    print(f"⏱️  {elapsed:.3f}s ({rate:.0f} files/s)")
 
 def main():
     import argparse
@@ -94,8 +163,14 @@ def main():
     parser.add_argument('start_date', nargs='?', help='Start date in YYYY-MM-DD format')
     parser.add_argument('end_date', nargs='?', help='End date in YYYY-MM-DD format')
     parser.add_argument('--start-date-counter', help='Start date for day counting in YYYY-MM-DD format')
+    parser.add_argument('-y', '--yes', action='store_true', help='Create files without asking for confirmation')
+    parser.add_argument('--dry-run', action='store_true', help='Only list the files that would be created')
+    parser.add_argument('-j', '--jobs', type=int, default=8, help='Number of parallel writers (default: 8)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
     
     args = parser.parse_args()
+    setup_profiling('create_missing_summaries', args.profile)
     
     # Validate date arguments
     if args.start_date and not args.end_date:
@@ -106,7 +181,8 @@ def main():
         print("Error: If end_date is provided, start_date must also be provided.")
         sys.exit(1)
     
-    create_missing_summaries(args.start_date, args.end_date, args.start_date_counter)
+    create_missing_summaries(args.start_date, args.end_date, args.start_date_counter,
+                             assume_yes=args.yes, dry_run=args.dry_run, jobs=args.jobs)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
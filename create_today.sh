@@ -6,12 +6,19 @@
 
 echo "Creating today's daily summary..."
 
+# Use the installed phd-summary command if available (pip install -e .)
+if command -v phd-summary >/dev/null 2>&1; then
+    PHD_SUMMARY=(phd-summary)
+else
+    PHD_SUMMARY=(python3 "$(dirname "$0")/phd_summary.py")
+fi
+
 # Check if start date is provided
 if [ $# -eq 1 ]; then
     echo "Using start date: $1"
-    python3 create_daily_summary.py --start-date "$1"
+    "${PHD_SUMMARY[@]}" new --start-date "$1"
 else
-    python3 create_daily_summary.py
+    "${PHD_SUMMARY[@]}" new
 fi
 
 # Check if the script was successful
@@ -21,4 +28,4 @@ if [ $? -eq 0 ]; then
 else
     echo "❌ Failed to create daily summary."
     exit 1
-fi 
\ No newline at end of file
+fi 
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Date arithmetic for day counters and missing ranges
+Works on date ordinals; missing ranges themselves are found by
+summary_calendar.PresenceCalendar.missing_ranges().
+"""
+
+from datetime import date
+
+def to_ordinal(value):
+    """Convert a 'YYYY-MM-DD' string, date or datetime to a day ordinal"""
+    if isinstance(value, str):
+        return date.fromisoformat(value).toordinal()
+    if hasattr(value, 'date'):
+        value = value.date()
+    return value.toordinal()
+
+def day_number(value, start):
+    """1-based day counter of a date relative to a start date, or None
+
+    None if start is unset, either date is invalid or the date is before
+    the start.
+    """
+    if not start:
+        return None
+    try:
+        number = to_ordinal(value) - to_ordinal(start) + 1
+    except ValueError:
+        return None
+    return number if number >= 1 else None
+
+def expand_ranges(ranges):
+    """Yield every missing date of the given ranges as 'YYYY-MM-DD'"""
+    for start, _end, count in ranges:
+        first = start.toordinal()
+        for ordinal in range(first, first + count):
+            yield date.fromordinal(ordinal).isoformat()
+
+def format_range(start, end, count):
+    """Format a missing range for display"""
+    if count == 1:
+        return start.isoformat()
+    return f"{start.isoformat()} → {end.isoformat()} ({count} days)"
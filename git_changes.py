@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Find the summary files touched in a git commit range
+Used by the --since / --paths options of the CI scripts so that a push
+which touches one summary only processes that summary.
+"""
+
+import os
+import re
+import subprocess
+
+from summary_profile import PROFILER
+
+# Flat (Summary/2025-08-03.md) or sharded (Summary/2025/08/2025-08-03.md) layout
+SUMMARY_PATH_RE = re.compile(r'^Summary/(?:\d{4}/\d{2}/)?\d{4}-\d{2}-\d{2}\.md$')
+
+# Changes to these paths affect every summary and force a full rebuild: the
+# configuration, the template and the root modules the CI scripts import
+# (keep in sync with the paths of .github/workflows/update-readme.yml)
+FULL_REBUILD_PATHS = (
+    'config.py', 'template.md',
+    'date_gaps.py',
+    'git_changes.py',
+    'summary_calendar.py',
+    'summary_config.py',
+    'summary_io.py',
+    'summary_manifest.py',
+    'summary_parser.py',
+    'summary_profile.py',
+    'summary_stats.py',
+    'summary_storage.py',
+    'template_engine.py',
+)
+FULL_REBUILD_PREFIXES = ('.github/scripts/',)
+
+class ChangeSet:
+    """Summary files added/modified and deleted in a commit range
+
+    revision is the commit the range ends at (None for explicit paths).
+    """
+
+    def __init__(self, changed, deleted, revision=None):
+        self.changed = sorted(changed)
+        self.deleted = sorted(deleted)
+        self.revision = revision
+
+def git_revision(rev='HEAD'):
+    """Full SHA of a revision, or None if it is unknown or git fails"""
+    try:
+        proc = subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f'{rev}^{{commit}}'],
+                              capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip() or None
+
+def is_ancestor(ancestor, rev='HEAD'):
+    """True if ancestor is rev or one of its ancestors"""
+    try:
+        subprocess.run(['git', 'merge-base', '--is-ancestor', ancestor, rev],
+                       capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+def listing_base(revision, since=None):
+    """Revision to diff from to bring a listing recorded at revision up to date
+
+    Returns None (full rebuild) if the listing has no revision or it is not
+    an ancestor of HEAD, e.g. after a force push. An older since is used
+    instead, so that its range is still fully processed.
+    """
+    if not revision or not is_ancestor(revision):
+        return None
+    if since and since != revision and is_ancestor(since, revision):
+        return since
+    return revision
+
+def git_changed_paths(since, until='HEAD'):
+    """Return the paths changed between two revisions, or None if git fails"""
+    # A zero SHA is what GitHub sends as "before" for a newly created branch
+    if not since or set(since) == {'0'}:
+        return None
+    with PROFILER.phase('scan'):
+        try:
+            proc = subprocess.run(
+                ['git', 'diff', '--name-only', '--no-renames', '-z', since, until],
+                capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    return [path for path in proc.stdout.split('\0') if path]
+
+def detect_changes(since=None, paths=None):
+    """Classify changed paths, returning a ChangeSet or None for a full rebuild
+
+    Either a revision (since) or an explicit list of paths can be given.
+    """
+    revision = None
+    if paths is None:
+        revision = git_revision()
+        paths = git_changed_paths(since, revision) if revision else None
+        if paths is None:
+            return None
+
+    changed = set()
+    deleted = set()
+    for path in paths:
+        path = os.path.normpath(path).replace(os.sep, '/')
+        if path in FULL_REBUILD_PATHS or path.startswith(FULL_REBUILD_PREFIXES):
+            return None
+        if not SUMMARY_PATH_RE.match(path):
+            continue
+        if os.path.exists(path):
+            changed.add(path)
+        else:
+            deleted.add(path)
+    return ChangeSet(changed, deleted, revision)
+
+def add_change_arguments(parser, incremental=False):
+    """Add the --since / --paths (and --incremental) options to an argparse parser"""
+    parser.add_argument('--since', metavar='REV',
+                        help='Only process summaries changed since this git revision')
+    parser.add_argument('--paths', nargs='+', metavar='PATH',
+                        help='Only process these changed paths')
+    if incremental:
+        parser.add_argument('--incremental', action='store_true',
+                            help='Only process summaries changed since the commit of the cached file list')
+
+def changes_from_args(args, manifest=None):
+    """Return a ChangeSet for --since/--paths/--incremental, or None for a full run
+
+    With a manifest that has a file list, git ranges start at the commit the
+    list was recorded at (see listing_base), so that the list cannot miss
+    summaries added by commits that were never processed.
+    """
+    since = args.since
+    if not since and not args.paths and not getattr(args, 'incremental', False):
+        return None
+    if manifest is not None and not args.paths and (manifest.listing is not None or not since):
+        since = listing_base(manifest.revision, since)
+        if since is None:
+            print("No cached file list for an ancestor of HEAD: full rebuild.")
+            return None
+    changes = detect_changes(since, args.paths)
+    if changes is None:
+        print("Change to config, template or scripts detected (or unknown revision): full rebuild.")
+    return changes
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+phd-summary: one command for all summary scripts
+Usage: phd-summary [-C DIR] <command> [options]
+
+    new       create today's summary (or the one for a given date)
+    backfill  create the summaries missing between two dates
+    fix       validate and fix the day counters
+    readme    regenerate README.md and the archive pages
+    stats     weekly, monthly and yearly statistics
+    search    full-text search of the summaries
+    export    export the summaries as JSON lines or CSV
+    site      build a static HTML site of the summaries
+
+Each command runs the main() of the matching script, so it accepts the same
+options (phd-summary new --help). Only the module of the chosen command is
+imported, which keeps `phd-summary new` fast enough for a shell alias.
+
+The repository is the nearest directory (from the current one upwards)
+containing template.md, config.py or Summary/, or SUMMARY_ROOT / -C DIR.
+"""
+
+import os
+import sys
+
+# command -> (module, description)
+COMMANDS = {
+    'new': ('create_daily_summary', "Create today's summary (or the one for a given date)"),
+    'backfill': ('create_missing_summaries', 'Create the summaries missing between two dates'),
+    'fix': ('fix_day_counters', 'Validate and fix the day counters'),
+    'readme': ('update_readme', 'Regenerate README.md and the archive pages'),
+    'stats': ('summary_stats', 'Weekly, monthly and yearly statistics'),
+    'search': ('summary_search', 'Full-text search of the summaries'),
+    'export': ('summary_export', 'Export the summaries as JSON lines or CSV'),
+    'site': ('summary_site', 'Build a static HTML site of the summaries'),
+}
+
+ROOT_MARKERS = ('template.md', 'config.py', 'Summary')
+SCRIPTS_DIR = os.path.join('.github', 'scripts')
+
+def find_repo_root(start=None):
+    """Nearest directory at or above start that looks like a summary repository"""
+    directory = os.path.abspath(start or os.getcwd())
+    while True:
+        if any(os.path.exists(os.path.join(directory, marker)) for marker in ROOT_MARKERS):
+            return directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def parse_args(argv=None):
+    """Split the command line into the global options, the command and its arguments"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='phd-summary', description='Daily summary tools',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='commands:\n' + '\n'.join(f'  {name:<10}{description}'
+                                         for name, (_, description) in COMMANDS.items()))
+    parser.add_argument('-C', dest='root', metavar='DIR',
+                        help='Repository to work in (default: SUMMARY_ROOT, else found from the current directory)')
+    parser.add_argument('command', choices=COMMANDS, metavar='command', help='One of the commands below')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Options of the command (see <command> --help)')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Entry point of the phd-summary command"""
+    args = parse_args(argv)
+
+    root = args.root or os.environ.get('SUMMARY_ROOT') or find_repo_root()
+    if not root or not os.path.isdir(root):
+        print(f"Error: no summary repository found (looked for {', '.join(ROOT_MARKERS)}); use -C DIR")
+        sys.exit(1)
+    # The scripts use paths relative to the repository root
+    os.chdir(root)
+    root = os.getcwd()
+    sys.path[:0] = [root, os.path.join(root, SCRIPTS_DIR)]
+
+    import importlib
+    module = importlib.import_module(COMMANDS[args.command][0])
+    sys.argv = [f'phd-summary {args.command}'] + args.args
+    module.main()
+
+if __name__ == '__main__':
+    main()
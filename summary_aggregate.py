@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Combined dashboard over many summary repositories (e.g. one per student)
+Usage: python summary_aggregate.py ~/notes/alice ~/notes/bob [--repos-file repos.txt] [-o DASHBOARD.md] [-j 4]
+
+Every repository is scanned with its own config.py (START_DATE, layout,
+template) by the same calendar and rollup code that builds its README:
+coverage, streaks, missing ranges and words per week. Repositories are
+scanned in parallel in a process pool.
+
+Results are cached in .summary_cache/aggregate.json by the HEAD commit of
+each repository, so only repositories with new commits are scanned again.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.github', 'scripts'))
+from date_gaps import format_range
+from summary_io import CACHE_DIR, write_if_changed
+from summary_profile import PROFILER, setup_profiling
+
+AGGREGATE_PATH = os.path.join(CACHE_DIR, 'aggregate.json')
+AGGREGATE_VERSION = 1
+
+# How much of each repository ends up in the dashboard
+WEEKS_SHOWN = 8
+MISSING_SHOWN = 5
+
+def repo_head(root):
+    """HEAD commit of a repository, or None if it is not a git checkout"""
+    try:
+        proc = subprocess.run(['git', '-C', root, 'rev-parse', 'HEAD'],
+                              capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+def scan_repo(root):
+    """Coverage, streaks, missing ranges and weekly words of one repository
+
+    Runs in a worker process: it changes into the repository so that its
+    config.py, template.md and summary cache are the ones used.
+    """
+    from summary_calendar import PresenceCalendar
+    from summary_manifest import SummaryManifest
+    from summary_stats import load_stats
+    from summary_storage import SummaryStore
+    from update_readme import calendar_range
+
+    os.chdir(root)
+    summary_files = SummaryStore().list_files()
+    manifest = SummaryManifest()
+    calendar = PresenceCalendar.from_files(summary_files, manifest)
+    result = {'name': os.path.basename(root), 'summaries': len(summary_files)}
+
+    range_start, range_end = calendar_range(calendar)
+    if range_start is None:
+        return result
+
+    present, total = calendar.coverage(range_start, range_end)
+    longest, latest = calendar.streaks(range_start, range_end)
+    missing = list(calendar.missing_ranges(range_start, range_end))
+    # Also saves the repository's own manifest and rollups for its next run
+    stats = load_stats(summary_files, manifest)
+
+    result.update({
+        'start': range_start.isoformat(),
+        'end': range_end.isoformat(),
+        'present': present,
+        'days': total,
+        'longest_streak': longest,
+        'latest_streak': latest,
+        'missing_days': sum(count for _start, _end, count in missing),
+        'missing_count': len(missing),
+        'missing_ranges': [format_range(start, end, count) for start, end, count in missing[-MISSING_SHOWN:]],
+        'weeks': {key: row['words'] for key, row in stats.rows('week', WEEKS_SHOWN)}
+    })
+    return result
+
+def load_cache(path=AGGREGATE_PATH):
+    """Load {root: {'head': sha, 'result': {...}}}, or an empty cache"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == AGGREGATE_VERSION:
+            return data['repos']
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def aggregate(roots, jobs=None):
+    """Return the results of all repositories (in the given order) and how many were scanned"""
+    cache = load_cache()
+    heads = {root: repo_head(root) for root in roots}
+    # Repositories outside git are always scanned
+    stale = [root for root in roots
+             if heads[root] is None or cache.get(root, {}).get('head') != heads[root]]
+
+    if stale:
+        with PROFILER.phase('scan'), ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [(root, executor.submit(scan_repo, root)) for root in stale]
+            for root, future in futures:
+                try:
+                    cache[root] = {'head': heads[root], 'result': future.result()}
+                except Exception as e:
+                    print(f"Warning: could not scan {root} ({e})")
+                    # Not cached under its HEAD, so it is retried on the next run
+                    cache[root] = {'head': None, 'result': {'name': os.path.basename(root), 'summaries': 0}}
+
+    cache = {root: cache[root] for root in roots}
+    write_if_changed(AGGREGATE_PATH, json.dumps({'version': AGGREGATE_VERSION, 'repos': cache},
+                                                indent=1, sort_keys=True) + '\n')
+    return [cache[root]['result'] for root in roots], len(stale)
+
+def render_dashboard(results):
+    """Render the combined dashboard markdown"""
+    content = "# Daily Summary Dashboard\n\n"
+    content += "| Person | Summaries | Coverage | Latest streak | Longest streak | Missing days | Last summary |\n"
+    content += "|---|---:|---:|---:|---:|---:|---|\n"
+    for result in results:
+        if 'days' not in result:
+            content += f"| {result['name']} | {result['summaries']} | – | – | – | – | – |\n"
+            continue
+        content += (f"| {result['name']} | {result['summaries']} | "
+                    f"{result['present']}/{result['days']} ({result['present'] / result['days']:.0%}) | "
+                    f"{result['latest_streak']} | {result['longest_streak']} | {result['missing_days']} | "
+                    f"{result['end']} |\n")
+
+    weeks = sorted({week for result in results for week in result.get('weeks', {})})[-WEEKS_SHOWN:]
+    if weeks:
+        content += "\n## Words per Week\n\n"
+        content += "| Person | " + " | ".join(weeks) + " |\n"
+        content += "|---|" + "---:|" * len(weeks) + "\n"
+        for result in results:
+            words = result.get('weeks', {})
+            content += f"| {result['name']} | " + " | ".join(str(words.get(week, '–')) for week in weeks) + " |\n"
+
+    missing = [result for result in results if result.get('missing_ranges')]
+    if missing:
+        content += "\n## Missing Summaries\n"
+        for result in missing:
+            content += f"\n### {result['name']}\n\n"
+            for missing_range in reversed(result['missing_ranges']):
+                content += f"- {missing_range}\n"
+            earlier = result['missing_count'] - len(result['missing_ranges'])
+            if earlier:
+                content += f"- ... and {earlier} earlier gaps ({result['missing_days']} missing days in total)\n"
+    return content
+
+def read_repos_file(path):
+    """Repository paths from a file, one per line ('#' starts a comment)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.split('#', 1)[0].strip() for line in f if line.split('#', 1)[0].strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description='Combined dashboard over many summary repositories')
+    parser.add_argument('repos', nargs='*', metavar='REPO', help='Root directories of the repositories')
+    parser.add_argument('--repos-file', metavar='PATH', help='File with one repository path per line')
+    parser.add_argument('-o', '--output', default='DASHBOARD.md', help='Dashboard file (default: DASHBOARD.md)')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    args = parser.parse_args()
+    setup_profiling('summary_aggregate', args.profile)
+
+    repos = list(args.repos)
+    if args.repos_file:
+        repos += read_repos_file(args.repos_file)
+    roots = list(dict.fromkeys(os.path.abspath(os.path.expanduser(repo)) for repo in repos))
+    missing = [root for root in roots if not os.path.isdir(root)]
+    if not roots or missing:
+        print(f"Error: no such repository: {', '.join(missing)}" if missing else "Error: no repositories given.")
+        sys.exit(1)
+
+    results, scanned = aggregate(roots, args.jobs)
+    print(f"Scanned {scanned} of {len(roots)} repositories ({len(roots) - scanned} unchanged).")
+    if write_if_changed(args.output, render_dashboard(results)):
+        print(f"Successfully updated {args.output}")
+    else:
+        print(f"{args.output} is already up to date")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Compact presence calendar of the summary archive
+One bytearray per year holds a level per day (indexed by day of year):
+    0      no summary
+    1      summary is still the untouched template
+    2..5   filled in, bucketed by word count
+Coverage, gaps and streaks are computed on byte slices of the calendar
+(bytes.count and regex scans in C) instead of sets of date strings, and the
+calendar is rendered as a GitHub-style heatmap SVG.
+"""
+
+import hashlib
+import re
+from datetime import date, timedelta
+
+from summary_parser import extract_date_from_filename
+
+LEVEL_MISSING = 0
+LEVEL_UNTOUCHED = 1
+# Filled summaries with fewer words than each bound get levels 2, 3, 4; more get 5
+WORD_BUCKETS = (100, 250, 500)
+
+MISSING_RUN_RE = re.compile(b'\x00+')
+PRESENT_RUN_RE = re.compile(b'[^\x00]+')
+FILLED_RUN_RE = re.compile(b'[^\x00\x01]+')
+
+HEATMAP_COLORS = ('#ebedf0', '#d0d7de', '#9be9a8', '#40c463', '#30a14e', '#216e39')
+HEATMAP_CELL = 11
+HEATMAP_GAP = 2
+HEATMAP_WEEKS = 53
+
+def entry_level(entry):
+    """Calendar level of a manifest entry"""
+    if not entry or not entry.get('has_content'):
+        return LEVEL_UNTOUCHED
+    words = entry.get('word_count', 0)
+    for level, bound in enumerate(WORD_BUCKETS, 2):
+        if words < bound:
+            return level
+    return len(WORD_BUCKETS) + 2
+
+class PresenceCalendar:
+    """Per-year day levels of the summary archive"""
+
+    def __init__(self):
+        self.years = {}
+        self.first = None
+        self.last = None
+
+    @classmethod
+    def from_files(cls, summary_files, manifest=None):
+        """Build the calendar from summary paths and their manifest entries
+
+        Without a manifest only presence is recorded (every summary gets
+        LEVEL_UNTOUCHED).
+        """
+        calendar = cls()
+        for filepath in summary_files:
+            date_str = extract_date_from_filename(filepath)
+            if not date_str:
+                continue
+            entry = manifest.get(filepath) if manifest else None
+            try:
+                calendar.mark(date.fromisoformat(date_str), entry_level(entry))
+            except ValueError:
+                continue
+        return calendar
+
+    def mark(self, day, level):
+        """Set the level of a day"""
+        days = self.years.get(day.year)
+        if days is None:
+            days = self.years[day.year] = bytearray(366)
+        days[day.timetuple().tm_yday - 1] = level
+        if level and (self.first is None or day < self.first):
+            self.first = day
+        if level and (self.last is None or day > self.last):
+            self.last = day
+
+    def level(self, day):
+        """Level of a day (LEVEL_MISSING if unknown)"""
+        days = self.years.get(day.year)
+        return days[day.timetuple().tm_yday - 1] if days else LEVEL_MISSING
+
+    def slice(self, start, end):
+        """Levels of the days start..end (inclusive) as bytes"""
+        parts = []
+        for year in range(start.year, end.year + 1):
+            first = start if year == start.year else date(year, 1, 1)
+            last = end if year == end.year else date(year, 12, 31)
+            days = self.years.get(year)
+            lo, hi = first.timetuple().tm_yday - 1, last.timetuple().tm_yday
+            parts.append(bytes(days[lo:hi]) if days else bytes(hi - lo))
+        return b''.join(parts)
+
+    def missing_ranges(self, start, end):
+        """Yield (start, end, count) for every run of missing days (start and end inclusive)"""
+        for run in MISSING_RUN_RE.finditer(self.slice(start, end)):
+            yield (start + timedelta(days=run.start()), start + timedelta(days=run.end() - 1),
+                   run.end() - run.start())
+
+    def coverage(self, start, end):
+        """Return (days with a summary, days in range)"""
+        levels = self.slice(start, end)
+        return len(levels) - levels.count(LEVEL_MISSING), len(levels)
+
+    def streaks(self, start, end, filled=False):
+        """Return (longest streak, streak ending on end) of days with a summary
+
+        With filled=True only summaries that were filled in count.
+        """
+        levels = self.slice(start, end)
+        runs = list((FILLED_RUN_RE if filled else PRESENT_RUN_RE).finditer(levels))
+        longest = max((run.end() - run.start() for run in runs), default=0)
+        latest = runs[-1].end() - runs[-1].start() if runs and runs[-1].end() == len(levels) else 0
+        return longest, latest
+
+def heatmap_window(end):
+    """First and last day shown in the heatmap (whole weeks, Sunday first)"""
+    last_sunday = end - timedelta(days=(end.weekday() + 1) % 7)
+    return last_sunday - timedelta(weeks=HEATMAP_WEEKS - 1), end
+
+def heatmap_fingerprint(calendar, end):
+    """Fingerprint of everything the heatmap shows"""
+    start, end = heatmap_window(end)
+    return hashlib.sha256(end.isoformat().encode('ascii') + calendar.slice(start, end)).hexdigest()
+
+def render_heatmap(calendar, end):
+    """Render the year ending on end as an SVG calendar heatmap"""
+    start, end = heatmap_window(end)
+    step = HEATMAP_CELL + HEATMAP_GAP
+    left, top = 30, 20
+    width = left + HEATMAP_WEEKS * step
+    height = top + 7 * step + 16
+
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="sans-serif" font-size="9" fill="#57606a">',
+        f'<!-- fingerprint: {heatmap_fingerprint(calendar, end)} -->'
+    ]
+    for row, label in ((1, 'Mon'), (3, 'Wed'), (5, 'Fri')):
+        lines.append(f'<text x="0" y="{top + row * step + 9}">{label}</text>')
+
+    levels = calendar.slice(start, end)
+    previous_month = None
+    for offset, level in enumerate(levels):
+        day = start + timedelta(days=offset)
+        week, row = divmod(offset, 7)
+        x, y = left + week * step, top + row * step
+        if row == 0 and day.month != previous_month:
+            lines.append(f'<text x="{x}" y="{top - 6}">{day.strftime("%b")}</text>')
+            previous_month = day.month
+        lines.append(f'<rect x="{x}" y="{y}" width="{HEATMAP_CELL}" height="{HEATMAP_CELL}" rx="2" '
+                     f'fill="{HEATMAP_COLORS[level]}"><title>{day.isoformat()}</title></rect>')
+
+    legend_x = width - 5 * step - 60
+    legend_y = top + 7 * step + 4
+    lines.append(f'<text x="{legend_x - 28}" y="{legend_y + 9}">Less</text>')
+    for i, color in enumerate(HEATMAP_COLORS[1:]):
+        lines.append(f'<rect x="{legend_x + i * step}" y="{legend_y}" width="{HEATMAP_CELL}" '
+                     f'height="{HEATMAP_CELL}" rx="2" fill="{color}"/>')
+    lines.append(f'<text x="{legend_x + 5 * step + 4}" y="{legend_y + 9}">More</text>')
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
+
+def heatmap_is_current(path, fingerprint):
+    """True if the SVG at path was rendered from the same calendar window"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            f.readline()
+            return f.readline().strip() == f'<!-- fingerprint: {fingerprint} -->'
+    except OSError:
+        return False
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Settings from config.py, loaded once per process
+config.py is loaded by path from the current directory (the repository
+root), so it is found without the repository on sys.path, e.g. from the
+installed phd-summary command. Any setting can be overridden with an
+environment variable of the same name (START_DATE=2025-09-01 ...); empty
+variables are ignored.
+"""
+
+import importlib.util
+import os
+import sys
+
+from summary_profile import PROFILER
+
+CONFIG_PATH = 'config.py'
+
+_configs = {}
+
+def load_config(path=CONFIG_PATH):
+    """Return the settings of config.py as a dict ({} if there is none)"""
+    key = os.path.abspath(path)
+    settings = _configs.get(key)
+    if settings is not None:
+        return settings
+
+    settings = {}
+    with PROFILER.phase('config'):
+        if os.path.exists(path):
+            spec = importlib.util.spec_from_file_location('config', path)
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+            except Exception as e:
+                print(f"Warning: could not load {path} ({e})")
+            else:
+                # Keep `import config` in older scripts consistent with this load
+                sys.modules['config'] = module
+                settings = {name: value for name, value in vars(module).items() if name.isupper()}
+    _configs[key] = settings
+    return settings
+
+def get_setting(name, default=None):
+    """A setting from the environment, else from config.py"""
+    value = os.environ.get(name)
+    if value:
+        return value
+    return load_config().get(name, default)
+
+def virtual_day_counters():
+    """True if DAY_COUNTER_MODE = "virtual" (counters computed when rendering, never stored)"""
+    return get_setting('DAY_COUNTER_MODE') == 'virtual'
+
+def reload_config():
+    """Forget the loaded settings so the next lookup re-reads config.py"""
+    _configs.clear()
+    sys.modules.pop('config', None)
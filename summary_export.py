@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Export the daily summaries as structured data
+Usage: python summary_export.py [--format jsonl|csv] [-o PATH] [--from 2025-01-01] [--to 2025-06-30] [--since REV]
+
+One record per summary with its date, day counter (from the title line, or
+computed from START_DATE with DAY_COUNTER_MODE = "virtual"),
+word and task counts and the text of every section. The export is a chain
+of generators (scan -> parse -> write): each summary is read line by line,
+converted and written before the next one is opened, so memory use does not
+depend on the size of the archive (only the file names are listed).
+
+With --since REV only the summaries added or changed since that git revision
+are exported, e.g. the commit of the previous export.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+from date_gaps import day_number
+from git_changes import add_change_arguments, detect_changes
+from summary_config import get_setting, virtual_day_counters
+from summary_parser import CHECKBOX_RE, COMPLETED_SECTION, TITLE_RE, extract_date_from_filename, iter_sections
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+
+FORMATS = ('jsonl', 'csv')
+FIELDS = ('date', 'day_counter', 'path', 'words', 'tasks_done', 'tasks_total')
+# CSV column for sections that are not in the template
+OTHER_COLUMN = 'other_sections'
+
+def template_sections(template_path='template.md'):
+    """Section titles of the template, in order"""
+    try:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            return [line[3:].strip() for line in f if line.startswith('## ')]
+    except OSError:
+        return []
+
+def scan(date_from=None, date_to=None, paths=None):
+    """Yield (date, path) of the summaries to export, oldest first"""
+    if paths is None:
+        paths = SummaryStore().list_files(date_from, date_to)
+    else:
+        paths = sorted(paths, key=os.path.basename)
+    for filepath in paths:
+        date_str = extract_date_from_filename(filepath)
+        if date_str and (not date_from or date_str >= date_from) and (not date_to or date_str <= date_to):
+            yield date_str, filepath
+
+def parse(summaries):
+    """Yield one record per (date, path), reading each file line by line"""
+    virtual_start = get_setting('START_DATE') if virtual_day_counters() else None
+    for date_str, filepath in summaries:
+        try:
+            with PROFILER.phase('read'):
+                f = open(filepath, 'r', encoding='utf-8')
+        except OSError as e:
+            print(f"Warning: could not read {filepath} ({e})", file=sys.stderr)
+            continue
+        PROFILER.count('files_read')
+        with f, PROFILER.phase('parse'):
+            title = TITLE_RE.match(f.readline())
+            if virtual_start:
+                day_counter = day_number(date_str, virtual_start)
+            else:
+                day_counter = int(title.group(2)) if title and title.group(2) else None
+            record = {
+                'date': date_str,
+                'day_counter': day_counter,
+                'path': filepath,
+                'words': 0,
+                'tasks_done': 0,
+                'tasks_total': 0,
+                'sections': {}
+            }
+            bodies = {}
+            # Line numbers are irrelevant here; the title line was already consumed
+            for section, _line_number, line in iter_sections(f):
+                bodies.setdefault(section, []).append(line)
+                record['words'] += len(line.split())
+                if section == COMPLETED_SECTION:
+                    checkbox = CHECKBOX_RE.match(line)
+                    if checkbox:
+                        record['tasks_total'] += 1
+                        record['tasks_done'] += checkbox.group(1) != ' '
+            record['sections'] = {section: '\n'.join(lines).strip('\n') for section, lines in bodies.items()}
+        yield record
+
+def write_jsonl(records, out):
+    """Write one JSON object per line; returns the number of records"""
+    count = 0
+    for record in records:
+        with PROFILER.phase('write'):
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+        count += 1
+    return count
+
+def write_csv(records, out, sections):
+    """Write a CSV with one column per template section; returns the number of records"""
+    writer = csv.writer(out)
+    writer.writerow(list(FIELDS) + sections + [OTHER_COLUMN])
+    count = 0
+    for record in records:
+        other = [f"## {section}\n{text}" for section, text in record['sections'].items() if section not in sections]
+        row = [record[field] for field in FIELDS]
+        row += [record['sections'].get(section, '') for section in sections]
+        row.append('\n\n'.join(other))
+        with PROFILER.phase('write'):
+            writer.writerow(row)
+        count += 1
+    return count
+
+def export(out, fmt='jsonl', date_from=None, date_to=None, paths=None):
+    """Stream the summaries to out in the given format; returns the number exported"""
+    records = parse(scan(date_from, date_to, paths))
+    if fmt == 'csv':
+        return write_csv(records, out, template_sections())
+    return write_jsonl(records, out)
+
+def main():
+    parser = argparse.ArgumentParser(description='Export daily summaries as JSON lines or CSV')
+    parser.add_argument('--format', choices=FORMATS,
+                        help='Output format (default: from the --output extension, else jsonl)')
+    parser.add_argument('-o', '--output', metavar='PATH', help='Write to PATH instead of stdout')
+    parser.add_argument('--from', dest='date_from', metavar='YYYY-MM-DD', help='Earliest date to include')
+    parser.add_argument('--to', dest='date_to', metavar='YYYY-MM-DD', help='Latest date to include')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    add_change_arguments(parser)
+    args = parser.parse_args()
+    setup_profiling('summary_export', args.profile)
+
+    fmt = args.format or ('csv' if args.output and args.output.endswith('.csv') else 'jsonl')
+
+    paths = None
+    if args.since or args.paths:
+        changes = detect_changes(args.since, args.paths)
+        if changes is None:
+            # Messages go to stderr so that they never end up in the exported data
+            print("Change to config, template or scripts detected (or unknown revision): full export.",
+                  file=sys.stderr)
+        else:
+            paths = changes.changed
+            if changes.deleted:
+                print(f"{len(changes.deleted)} summaries were deleted since {args.since or 'then'}.",
+                      file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as out:
+            count = export(out, fmt, args.date_from, args.date_to, paths)
+        print(f"Exported {count} summaries to {args.output}", file=sys.stderr)
+    else:
+        try:
+            export(sys.stdout, fmt, args.date_from, args.date_to, paths)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`): point stdout at devnull so
+            # that the flush at interpreter exit does not raise again
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the SQLite caches under .summary_cache
+Each cache keeps a `docs` table with the fingerprint (size, mtime) of every
+indexed summary; sync_documents() re-indexes only the summaries whose
+fingerprint changed and drops the ones that were deleted.
+"""
+
+import os
+import sqlite3
+
+from summary_parser import extract_date_from_filename
+
+DOCS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_date ON docs (date);
+"""
+
+def open_database(path, schema, version):
+    """Open a cache database, recreating it if it was built by another version"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+
+    # Missing or built by an older version: start from scratch
+    if row is None or row[0] != str(version):
+        conn.close()
+        if os.path.exists(path):
+            os.remove(path)
+        conn = sqlite3.connect(path)
+        conn.executescript(DOCS_SCHEMA + schema)
+        with conn:
+            conn.execute("INSERT INTO meta VALUES ('version', ?)", (str(version),))
+    return conn
+
+def sync_documents(conn, summary_files, tables, index_document):
+    """Bring a cache in line with the given summary files
+
+    tables lists the tables holding per-document rows (with a `doc`
+    column); they are cleared for changed and deleted summaries.
+    index_document(conn, doc_id, filepath, date_str) is called for every new
+    or changed summary. Returns the number of summaries (re-)indexed.
+    """
+    indexed = {path: (doc_id, size, mtime_ns) for doc_id, path, size, mtime_ns
+               in conn.execute("SELECT id, path, size, mtime_ns FROM docs")}
+    reindexed = 0
+
+    def clear(doc_id):
+        for table in tables:
+            conn.execute(f"DELETE FROM {table} WHERE doc = ?", (doc_id,))
+
+    with conn:
+        for filepath in summary_files:
+            date_str = extract_date_from_filename(filepath)
+            if not date_str:
+                continue
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                continue
+            known = indexed.pop(filepath, None)
+            if known and known[1:] == (st.st_size, st.st_mtime_ns):
+                continue
+
+            if known:
+                doc_id = known[0]
+                clear(doc_id)
+                conn.execute("UPDATE docs SET size = ?, mtime_ns = ? WHERE id = ?",
+                             (st.st_size, st.st_mtime_ns, doc_id))
+            else:
+                doc_id = conn.execute("INSERT INTO docs (path, date, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                                      (filepath, date_str, st.st_size, st.st_mtime_ns)).lastrowid
+            index_document(conn, doc_id, filepath, date_str)
+            reindexed += 1
+
+        # Whatever is left in `indexed` no longer exists
+        for doc_id, _size, _mtime_ns in indexed.values():
+            clear(doc_id)
+            conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    return reindexed
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Small file helpers shared by the summary scripts
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+from summary_profile import PROFILER
+
+CACHE_DIR = '.summary_cache'
+
+def read_text(filepath):
+    """Read a file as text, returning (content, raw_bytes)"""
+    with PROFILER.phase('read'):
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    PROFILER.count('files_read')
+    PROFILER.count('bytes_read', len(data))
+    # Match the newline handling of open(..., 'r')
+    content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return content, data
+
+def atomic_write_text(filepath, content):
+    """Write text to a file via a temporary file and rename"""
+    directory = os.path.dirname(filepath) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with PROFILER.phase('write'):
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            if os.path.exists(filepath):
+                shutil.copymode(filepath, tmp_path)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    PROFILER.count('files_written')
+
+def write_if_changed(filepath, content):
+    """Atomically write text unless the file already has the same content hash
+
+    Returns True if the file was written, False if it was left untouched.
+    """
+    new_hash = hashlib.sha256(content.encode('utf-8')).digest()
+    try:
+        with PROFILER.phase('read'):
+            with open(filepath, 'rb') as f:
+                old_hash = hashlib.sha256(f.read()).digest()
+    except OSError:
+        old_hash = None
+    if old_hash == new_hash:
+        PROFILER.count('writes_skipped')
+        return False
+    atomic_write_text(filepath, content)
+    return True
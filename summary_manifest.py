@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Persistent manifest of parsed summary files
+Keeps a fingerprint (size, mtime, content hash) and the parsed fields of
+every summary so that scripts only re-read files that actually changed.
+The fill status of each summary is relative to template.md, so entries are
+dropped when the template changes.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from git_changes import git_revision
+from summary_io import CACHE_DIR, atomic_write_text, read_text
+from summary_parser import COMPLETED_SECTION, extract_date_from_filename, iter_checkboxes
+from summary_profile import PROFILER
+from template_engine import FILLED, UNTOUCHED, TemplateFingerprint, template_digest
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'manifest.json')
+MANIFEST_VERSION = 4
+
+DAY_COUNTER_RE = re.compile(r'# Daily Summary - \d{4}-\d{2}-\d{2} \[Day (\d+)\]')
+
+def parse_summary(content, status=None):
+    """Parse the fields tracked by the manifest from file content
+
+    status is the fill state from TemplateFingerprint.classify(); without
+    a template, any line that is not an empty checkbox counts as content.
+    """
+    match = DAY_COUNTER_RE.search(content)
+    lines = content.split('\n')
+
+    if status is None:
+        status = FILLED if any(line.strip() and not line.strip().startswith('- [ ]')
+                               for line in lines) else UNTOUCHED
+
+    # Checkbox items under "Today's Completed Work"
+    completed = [checked for section, _line, _text, checked in iter_checkboxes(lines)
+                 if section == COMPLETED_SECTION]
+
+    return {
+        'day_counter': match.group(1) if match else "None",
+        'line_count': len(lines),
+        'word_count': len(content.split()),
+        'status': status,
+        'has_content': status != UNTOUCHED,
+        'tasks_done': sum(completed),
+        'tasks_total': len(completed)
+    }
+
+class SummaryManifest:
+    """Fingerprint-keyed cache of parsed summary files"""
+
+    def __init__(self, path=MANIFEST_PATH, template_path='template.md'):
+        self.path = path
+        self.entries = {}
+        # Full list of summary files as of the last complete scan, kept up
+        # to date by apply_changes() in incremental runs, and the commit the
+        # README and archive were last brought up to date with (incremental
+        # runs diff from there, see set_revision)
+        self.listing = None
+        self.revision = None
+        # Set by apply_changes(): files outside the ChangeSet are unchanged
+        self.trust_unchanged = False
+        self.dirty = False
+        self.files_read = 0
+        self.template_path = template_path
+        self._fingerprint = None
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk, ignoring missing or stale formats"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.listing = data.get('listing')
+            self.revision = data.get('revision')
+            if data.get('template') == self.template_sha():
+                self.entries = data.get('files', {})
+            else:
+                # Fill states were computed against another template
+                self.dirty = True
+
+    def template_sha(self):
+        """sha256 of template.md, or None if there is no template"""
+        try:
+            return template_digest(self.template_path)
+        except OSError:
+            return None
+
+    @property
+    def fingerprint(self):
+        """TemplateFingerprint for classifying summaries (None without a template)"""
+        if self._fingerprint is None and self.template_sha() is not None:
+            self._fingerprint = TemplateFingerprint(self.template_path)
+        return self._fingerprint
+
+    def save(self):
+        """Write the manifest back to disk if anything changed"""
+        if not self.dirty:
+            return
+        data = {'version': MANIFEST_VERSION, 'template': self.template_sha(),
+                'files': self.entries, 'listing': self.listing, 'revision': self.revision}
+        atomic_write_text(self.path, json.dumps(data, indent=1, sort_keys=True) + '\n')
+        self.dirty = False
+
+    def lookup(self, filepath, st):
+        """Return the cached entry if it still matches the file's stat, else None"""
+        entry = self.entries.get(filepath)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            return entry
+        return None
+
+    def get(self, filepath):
+        """Return the entry for a file, re-parsing it only if its fingerprint changed"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            self.forget(filepath)
+            return None
+
+        entry = self.lookup(filepath, st)
+        if entry is not None:
+            return entry
+        entry = self.entries.get(filepath)
+        if self.trust_unchanged and entry and entry['size'] == st.st_size:
+            # Unchanged since the listing (only its mtime differs, e.g. after a
+            # fresh checkout in CI): keep the entry and remember the new mtime
+            entry['mtime_ns'] = st.st_mtime_ns
+            self.dirty = True
+            return entry
+
+        content, data = read_text(filepath)
+        return self.record(filepath, content, data, st)
+
+    def record(self, filepath, content, data=None, st=None):
+        """Store the parsed fields of content that was just read or written"""
+        if data is None:
+            data = content.encode('utf-8')
+        if st is None:
+            st = os.stat(filepath)
+        self.files_read += 1
+
+        sha256 = hashlib.sha256(data).hexdigest()
+        with PROFILER.phase('parse'):
+            status = None
+            date_str = extract_date_from_filename(filepath)
+            if date_str and self.fingerprint is not None:
+                status = self.fingerprint.classify(content, len(data), sha256, date_str)
+            entry = parse_summary(content, status)
+        entry.update({
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha256': sha256
+        })
+        self.entries[filepath] = entry
+        self.dirty = True
+        return entry
+
+    def forget(self, filepath):
+        """Drop the entry for a file that no longer exists"""
+        if self.entries.pop(filepath, None) is not None:
+            self.dirty = True
+
+    def prune(self, filepaths):
+        """Drop entries for files that are not in the complete list of summaries"""
+        filepaths = sorted(filepaths)
+        for stale in set(self.entries) - set(filepaths):
+            self.forget(stale)
+        if filepaths != self.listing:
+            self.listing = filepaths
+            self.dirty = True
+
+    def apply_changes(self, changes):
+        """Update the listing from a git_changes.ChangeSet
+
+        Changed files are re-parsed on next access and deleted files are
+        dropped. Returns the updated listing, or None if no complete scan
+        has been recorded yet (the caller must then do a full scan). The
+        other listed files are then taken to be unchanged even if their
+        mtime differs, so a fresh checkout does not re-read every summary.
+        """
+        if self.listing is None:
+            return None
+        listing = set(self.listing)
+        for filepath in changes.changed:
+            self.forget(filepath)
+            listing.add(filepath)
+        for filepath in changes.deleted:
+            self.forget(filepath)
+            listing.discard(filepath)
+        self.listing = sorted(listing)
+        self.trust_unchanged = True
+        self.dirty = True
+        return self.listing
+
+    def set_revision(self, changes=None):
+        """Record the commit the README and archive are now up to date with
+
+        That is HEAD after a full scan (changes is None) or the end of a git
+        range. Runs on explicit paths (--paths, watch mode) leave it alone:
+        commits they did not look at are still to be diffed.
+        """
+        revision = git_revision() if changes is None else changes.revision
+        if revision and revision != self.revision:
+            self.revision = revision
+            self.dirty = True
+
+    def refresh(self, filepaths):
+        """Bring the manifest in line with the given set of files"""
+        filepaths = set(filepaths)
+        self.prune(filepaths)
+        return {filepath: self.get(filepath) for filepath in filepaths}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Streaming parser for daily summary files
+Splits a summary into its template sections ("Today's Completed Work",
+"Issues Encountered", ...) line by line without loading more than needed.
+"""
+
+import os
+import re
+
+FILENAME_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})\.md$')
+# Title line: "# Daily Summary - YYYY-MM-DD" with an optional " [Day N]"
+TITLE_RE = re.compile(r'(# Daily Summary - \d{4}-\d{2}-\d{2})(?: \[Day (\d+)\])?')
+CHECKBOX_RE = re.compile(r'^\s*[-*+]\s+\[([ xX])\]\s*(.*?)\s*$')
+
+COMPLETED_SECTION = "Today's Completed Work"
+PLAN_SECTION = "Tomorrow's Plan"
+
+def extract_date_from_filename(filename):
+    """Extract date from filename (e.g., 'Summary/2024-01-15.md' -> '2024-01-15')"""
+    basename = os.path.basename(filename)
+    date_match = FILENAME_DATE_RE.match(basename)
+    return date_match.group(1) if date_match else None
+
+def iter_sections(lines):
+    """Yield (section, line_number, line) for the body lines of each section
+
+    lines is any iterable of lines (a list or an open file). Headings, the
+    title and the footer after '---' are not yielded; line numbers are
+    1-based and refer to the original file.
+    """
+    section = None
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if line.startswith('## '):
+            section = line[3:].strip()
+            continue
+        if line.startswith('# '):
+            section = None
+            continue
+        if line.strip() == '---':
+            section = None
+            continue
+        if section is not None:
+            yield section, line_number, line
+
+def extract_section(content, title):
+    """Return the body of a '## title' section, without surrounding blank lines"""
+    body = [line for section, _number, line in iter_sections(content.split('\n'))
+            if section == title]
+    return '\n'.join(body).strip('\n')
+
+def iter_checkboxes(lines):
+    """Yield (section, line_number, text, checked) for every '- [ ]' / '- [x]' item"""
+    for section, line_number, line in iter_sections(lines):
+        match = CHECKBOX_RE.match(line)
+        if match:
+            yield section, line_number, match.group(2), match.group(1) != ' '
+
+def normalize_item(text):
+    """Normalize item text so the same task matches across days"""
+    return ' '.join(text.lower().split())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Lightweight per-phase timing for the summary scripts
+Enable with --profile on any script or by setting SUMMARY_PROFILE=1.
+When enabled, a JSON report with per-phase timings and counters is written
+to stderr at exit (or to SUMMARY_PROFILE_OUTPUT), and a cProfile dump is
+saved if SUMMARY_PROFILE_CPROFILE names a file.
+
+Phases: config, scan, read, parse, render, write
+Phase times are exclusive: time spent in a nested phase (e.g. a read during
+rendering) is only counted once, in the innermost phase.
+Counters: files_scanned, files_read, bytes_read, files_written, files_rewritten
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+def process_age():
+    """Seconds since this process started (Linux only, else None)"""
+    try:
+        with open('/proc/self/stat', 'r') as f:
+            # Field 22 is the start time in clock ticks since boot; the command
+            # name (field 2) may contain spaces, so split after its ')'
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime', 'r') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class Profiler:
+    """Accumulates phase timings and counters for one script run"""
+
+    def __init__(self):
+        self.enabled = False
+        self.script = None
+        self.phases = {}
+        self.counters = {}
+        self.started = None
+        self.startup = None
+        self.cprofile = None
+        self._local = threading.local()
+
+    def enable(self, script):
+        """Start collecting and register the report to be written at exit"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.script = script
+        self.started = time.perf_counter()
+        self.startup = process_age()
+        if os.environ.get('SUMMARY_PROFILE_CPROFILE'):
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        atexit.register(self.report)
+
+    def phase(self, name):
+        """Context manager that adds the time spent inside it to a phase"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed(name)
+
+    def _charge(self, frame, now):
+        name, since = frame
+        self.phases[name] = self.phases.get(name, 0.0) + now - since
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        # Each thread keeps a stack of [phase, since]; entering a nested phase
+        # charges the time so far to the enclosing one
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        now = time.perf_counter()
+        if stack:
+            self._charge(stack[-1], now)
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._charge(stack.pop(), now)
+            if stack:
+                stack[-1][1] = now
+
+    def count(self, name, amount=1):
+        """Increment a counter"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self):
+        """Write the JSON report (and the cProfile dump, if requested)"""
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.started
+        data = {
+            'script': self.script,
+            'startup_s': round(self.startup, 6) if self.startup is not None else None,
+            'total_s': round(total, 6),
+            'phases_s': {name: round(value, 6) for name, value in sorted(self.phases.items())},
+            'counters': dict(sorted(self.counters.items()))
+        }
+
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(os.environ['SUMMARY_PROFILE_CPROFILE'])
+            data['cprofile'] = os.environ['SUMMARY_PROFILE_CPROFILE']
+
+        text = json.dumps(data, indent=2) + '\n'
+        output = os.environ.get('SUMMARY_PROFILE_OUTPUT')
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            sys.stderr.write(text)
+        self.enabled = False
+
+PROFILER = Profiler()
+
+def setup_profiling(script, flag=False):
+    """Enable profiling if --profile was given or SUMMARY_PROFILE is set"""
+    if flag or os.environ.get('SUMMARY_PROFILE', '') not in ('', '0'):
+        PROFILER.enable(script)
+    return PROFILER
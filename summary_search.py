@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Full-text search over daily summaries
+Usage: python summary_search.py "CUDA OOM" [--section "Issues Encountered"] [--from 2025-01-01] [--to 2025-06-30]
+
+Builds a persistent inverted index (term -> summary, section, line, position)
+in .summary_cache/search.sqlite. Before each query the index is brought up
+to date: only summaries whose size or mtime changed are re-indexed.
+Words are matched case-insensitively; "quoted text" is matched as a phrase.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from summary_io import CACHE_DIR
+from summary_index import open_database, sync_documents
+from summary_parser import iter_sections
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'search.sqlite')
+INDEX_VERSION = 2
+
+TOKEN_RE = re.compile(r'\w+')
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Postings are clustered by (term, doc, pos) so a term lookup is a single
+# range scan; sections are interned to keep rows small.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    section INTEGER NOT NULL,
+    line INTEGER NOT NULL,
+    PRIMARY KEY (term, doc, pos)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+"""
+
+def tokenize(text):
+    """Split text into lowercase terms"""
+    return [token.lower() for token in TOKEN_RE.findall(text)]
+
+def open_index(path=INDEX_PATH):
+    """Open (and create if needed) the search index"""
+    return open_database(path, SCHEMA, INDEX_VERSION)
+
+def section_ids(conn):
+    """Return the {name: id} map of interned section names"""
+    return {name: section_id for section_id, name in conn.execute("SELECT id, name FROM sections")}
+
+def iter_postings(conn, sections, filepath, doc_id):
+    """Yield posting rows for one summary file
+
+    Positions count words through the whole file; phrase matching also
+    requires the same section, so a phrase never spans two sections.
+    """
+    with PROFILER.phase('read'):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    PROFILER.count('files_read')
+
+    with PROFILER.phase('parse'):
+        position = 0
+        for section, line_number, line in iter_sections(lines):
+            section_id = sections.get(section)
+            if section_id is None:
+                section_id = conn.execute("INSERT INTO sections (name) VALUES (?)", (section,)).lastrowid
+                sections[section] = section_id
+            for term in tokenize(line):
+                yield term, doc_id, position, section_id, line_number
+                position += 1
+
+def update_index(conn, summary_files):
+    """Re-index changed summaries and drop deleted ones; returns files re-indexed"""
+    sections = section_ids(conn)
+
+    def index_document(conn, doc_id, filepath, _date_str):
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?, ?)",
+                         list(iter_postings(conn, sections, filepath, doc_id)))
+
+    return sync_documents(conn, summary_files, ('postings',), index_document)
+
+def parse_query(query):
+    """Split a query into a list of phrases (each a list of terms)"""
+    phrases = []
+    for quoted, word in QUERY_RE.findall(query):
+        terms = tokenize(quoted if quoted else word)
+        if quoted:
+            if terms:
+                phrases.append(terms)
+        else:
+            phrases.extend([term] for term in terms)
+    return phrases
+
+def phrase_matches(conn, terms, section=None, date_from=None, date_to=None):
+    """Return {(path, date, section): set(lines)} for one phrase"""
+    # p0 JOIN p1 ON p1.pos = p0.pos + 1 ... for consecutive terms
+    joins = ["JOIN docs d ON d.id = p0.doc", "JOIN sections s ON s.id = p0.section"]
+    join_params = []
+    for i, term in enumerate(terms[1:], 1):
+        joins.append(f"JOIN postings p{i} ON p{i}.term = ? AND p{i}.doc = p0.doc "
+                     f"AND p{i}.pos = p0.pos + {i} AND p{i}.section = p0.section")
+        join_params.append(term)
+
+    where = ["p0.term = ?"]
+    where_params = [terms[0]]
+    if section:
+        where.append("s.name = ? COLLATE NOCASE")
+        where_params.append(section)
+    if date_from:
+        where.append("d.date >= ?")
+        where_params.append(date_from)
+    if date_to:
+        where.append("d.date <= ?")
+        where_params.append(date_to)
+    params = join_params + where_params
+
+    sql = (f"SELECT d.path, d.date, s.name, p0.line FROM postings p0 {' '.join(joins)} "
+           f"WHERE {' AND '.join(where)}")
+    matches = {}
+    for path, date_str, found_section, line in conn.execute(sql, params):
+        matches.setdefault((path, date_str, found_section), set()).add(line)
+    return matches
+
+def search(conn, query, section=None, date_from=None, date_to=None):
+    """Return matches for all phrases of the query, newest first
+
+    Each result is (path, date, section, sorted line numbers); every phrase
+    must occur in the same section of the same summary.
+    """
+    phrases = parse_query(query)
+    if not phrases:
+        return []
+
+    results = None
+    for terms in phrases:
+        matches = phrase_matches(conn, terms, section, date_from, date_to)
+        if results is None:
+            results = matches
+        else:
+            results = {key: results[key] | lines for key, lines in matches.items() if key in results}
+        if not results:
+            return []
+
+    return sorted(((path, date_str, found_section, sorted(lines))
+                   for (path, date_str, found_section), lines in results.items()),
+                  key=lambda result: (result[1], result[2]), reverse=True)
+
+def read_lines(filepath, line_numbers):
+    """Return the text of the given (1-based) lines of a file"""
+    wanted = set(line_numbers)
+    found = {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if number in wanted:
+                found[number] = line.rstrip('\n')
+                if len(found) == len(wanted):
+                    break
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description='Search daily summaries')
+    parser.add_argument('query', nargs='*', help='Words to search for; use "quotes" for phrases')
+    parser.add_argument('-s', '--section', help='Only search this section (e.g. "Issues Encountered")')
+    parser.add_argument('--from', dest='date_from', metavar='YYYY-MM-DD', help='Earliest date to include')
+    parser.add_argument('--to', dest='date_to', metavar='YYYY-MM-DD', help='Latest date to include')
+    parser.add_argument('-n', '--limit', type=int, default=20, help='Maximum number of results (default: 20)')
+    parser.add_argument('--no-update', action='store_true', help='Query the index without refreshing it first')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the index from scratch')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    args = parser.parse_args()
+    setup_profiling('summary_search', args.profile)
+
+    if args.rebuild and os.path.exists(INDEX_PATH):
+        os.remove(INDEX_PATH)
+    conn = open_index()
+
+    if not args.no_update:
+        reindexed = update_index(conn, SummaryStore().list_files())
+        if reindexed and not args.query:
+            print(f"Indexed {reindexed} summary files.")
+
+    if not args.query:
+        return
+
+    with PROFILER.phase('search'):
+        results = search(conn, ' '.join(args.query), args.section, args.date_from, args.date_to)
+
+    if not results:
+        print("No matches found.")
+        sys.exit(1)
+
+    for path, date_str, section, lines in results[:args.limit]:
+        print(f"{date_str}  [{section}]  {path}")
+        for number, text in sorted(read_lines(path, lines).items()):
+            print(f"    {number}: {text.strip()}")
+
+    if len(results) > args.limit:
+        print(f"\n... and {len(results) - args.limit} more matches (use --limit to show more)")
+
+if __name__ == '__main__':
+    main()
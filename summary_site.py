@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Static HTML site of the daily summaries
+Usage: python summary_site.py [-o _site] [-j 4] [--force]
+
+Writes one page per day (_site/YYYY/MM/YYYY-MM-DD.html), an index per month
+and year, a front page and search.json (date, title, URL, word count,
+sections and an excerpt of every summary) for client-side search.
+
+Day pages are rendered in parallel in a process pool and only when their
+dependency fingerprint changes: the content hash of the summary (from the
+manifest), template.md, config.py (START_DATE and the day counters) and the
+neighbouring days linked from the page. The fingerprints and search records
+are kept in .summary_cache/site.json, so the indexes and search.json are
+rebuilt without reading any unchanged summary.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.github', 'scripts'))
+from summary_config import get_setting
+from summary_io import CACHE_DIR, write_if_changed
+from summary_manifest import SummaryManifest
+from summary_parser import TITLE_RE, extract_date_from_filename, iter_sections
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+from update_readme import STATUS_ICONS, calculate_day_counter, format_date_for_display, get_recent_count
+
+SITE_DIR = '_site'
+SITE_CACHE_PATH = os.path.join(CACHE_DIR, 'site.json')
+# Bump when the page layout changes so every page is rendered again
+SITE_VERSION = 1
+# Files whose content every page depends on
+SITE_INPUTS = ('template.md', 'config.py')
+
+EXCERPT_LENGTH = 200
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{root}style.css">
+</head>
+<body>
+<nav>{nav}</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+STYLE = """body { font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif; line-height: 1.5;
+       max-width: 46rem; margin: 2rem auto; padding: 0 1rem; color: #1f2328; }
+nav { font-size: 0.9rem; margin-bottom: 1.5rem; color: #59636e; }
+nav a, main a { color: #0969da; text-decoration: none; }
+h1 { font-size: 1.6rem; border-bottom: 1px solid #d1d9e0; padding-bottom: 0.3rem; }
+h2 { font-size: 1.25rem; margin-top: 1.5rem; }
+ul.tasks { list-style: none; padding-left: 0.5rem; }
+pre { background: #f6f8fa; padding: 0.75rem; overflow-x: auto; }
+code { background: #f6f8fa; padding: 0.1rem 0.3rem; }
+footer { margin-top: 2rem; font-size: 0.9rem; color: #59636e; }
+"""
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+LIST_ITEM_RE = re.compile(r'^\s*(?:[-*+]|(\d+)\.)\s+(?:\[([ xX])\]\s+)?(.*)$')
+HR_RE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+INLINE_RE = re.compile(r'`([^`]+)`|\*\*(.+?)\*\*|__(.+?)__|\*(.+?)\*|\b_(.+?)_\b|\[([^\]]+)\]\(([^)\s]+)\)|<(https?://[^>]+)>')
+
+def render_inline(text):
+    """Render code spans, emphasis and links of one line of markdown"""
+    parts = []
+    position = 0
+    for match in INLINE_RE.finditer(text):
+        parts.append(html.escape(text[position:match.start()]))
+        code, strong, strong2, em, em2, label, url, autolink = match.groups()
+        if code is not None:
+            parts.append(f'<code>{html.escape(code)}</code>')
+        elif strong is not None or strong2 is not None:
+            parts.append(f'<strong>{render_inline(strong or strong2)}</strong>')
+        elif em is not None or em2 is not None:
+            parts.append(f'<em>{render_inline(em or em2)}</em>')
+        elif label is not None:
+            parts.append(f'<a href="{html.escape(url)}">{render_inline(label)}</a>')
+        else:
+            parts.append(f'<a href="{html.escape(autolink)}">{html.escape(autolink)}</a>')
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return ''.join(parts)
+
+def markdown_to_html(text):
+    """Render the markdown used in summaries as HTML
+
+    Supports headings, bullet, numbered and task lists, fenced code blocks,
+    rules, paragraphs and inline code, emphasis and links; nested lists are
+    flattened.
+    """
+    out = []
+    paragraph = []
+    list_tag = None
+    code = None
+
+    def close_paragraph():
+        if paragraph:
+            out.append('<p>' + '<br>\n'.join(render_inline(line) for line in paragraph) + '</p>')
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            out.append(f'</{list_tag}>')
+            list_tag = None
+
+    for line in text.split('\n'):
+        if code is not None:
+            if line.strip().startswith('```'):
+                out.append('<pre><code>' + html.escape('\n'.join(code)) + '</code></pre>')
+                code = None
+            else:
+                code.append(line)
+            continue
+        if line.strip().startswith('```'):
+            close_paragraph()
+            close_list()
+            code = []
+            continue
+        if not line.strip():
+            close_paragraph()
+            close_list()
+            continue
+
+        heading = HEADING_RE.match(line)
+        item = LIST_ITEM_RE.match(line)
+        if heading:
+            close_paragraph()
+            close_list()
+            level = len(heading.group(1))
+            out.append(f'<h{level}>{render_inline(heading.group(2))}</h{level}>')
+        elif HR_RE.match(line):
+            close_paragraph()
+            close_list()
+            out.append('<hr>')
+        elif item:
+            close_paragraph()
+            number, checkbox, item_text = item.groups()
+            tag = 'ol' if number else 'ul'
+            if list_tag != tag:
+                close_list()
+                out.append(f'<{tag} class="tasks">' if checkbox is not None else f'<{tag}>')
+                list_tag = tag
+            if checkbox is not None:
+                checked = ' checked' if checkbox != ' ' else ''
+                out.append(f'<li><input type="checkbox" disabled{checked}> {render_inline(item_text)}</li>')
+            else:
+                out.append(f'<li>{render_inline(item_text)}</li>')
+        else:
+            close_list()
+            paragraph.append(line.strip())
+
+    if code is not None:
+        out.append('<pre><code>' + html.escape('\n'.join(code)) + '</code></pre>')
+    close_paragraph()
+    close_list()
+    return '\n'.join(out)
+
+def day_url(date_str):
+    """'2025-08-03' -> '2025/08/2025-08-03.html' (relative to the site root)"""
+    return f'{date_str[:4]}/{date_str[5:7]}/{date_str}.html'
+
+def render_page(title, body, nav, root):
+    """Wrap a page body in the site layout"""
+    return PAGE.format(title=html.escape(title), body=body, nav=nav, root=root)
+
+def render_day_page(task):
+    """Render one day page and return its search fields (runs in a worker)
+
+    task is (source path, output path, title, navigation HTML).
+    """
+    filepath, output_path, title, nav = task
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    lines = content.split('\n')
+    # The title is rendered from the date so it follows the current START_DATE
+    if lines and TITLE_RE.match(lines[0]):
+        lines = lines[1:]
+    body = f'<h1>{html.escape(title)}</h1>\n' + markdown_to_html('\n'.join(lines))
+
+    sections = {}
+    for section, _line_number, line in iter_sections(content.split('\n')):
+        if line.strip():
+            sections.setdefault(section, []).append(line.strip())
+    excerpt = ' '.join(' '.join(section_lines) for section_lines in sections.values())
+
+    write_if_changed(output_path, render_page(title, body, nav, '../../'))
+    return {'sections': list(sections), 'excerpt': excerpt[:EXCERPT_LENGTH]}
+
+def inputs_digest(start_date_str):
+    """Fingerprint of everything outside a summary that its page depends on"""
+    digest = hashlib.sha256(f'{SITE_VERSION}\0{start_date_str}'.encode('utf-8'))
+    for path in SITE_INPUTS:
+        try:
+            with open(path, 'rb') as f:
+                digest.update(b'\0' + f.read())
+        except OSError:
+            digest.update(b'\0')
+    return digest.hexdigest()
+
+def load_site_cache(output_dir, path=SITE_CACHE_PATH):
+    """Load {date: {'fingerprint', 'record'}} for a site directory, or an empty map"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == SITE_VERSION and data.get('output') == output_dir:
+            return data['pages']
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def day_nav(date_str, previous_date, next_date):
+    """Breadcrumb and previous/next links of a day page"""
+    year, month = date_str[:4], date_str[:7]
+    links = [f'<a href="../../index.html">Home</a>',
+             f'<a href="../index.html">{year}</a>',
+             f'<a href="index.html">{html.escape(format_date_for_display(month + "-01").replace(" 01,", ""))}</a>']
+    nav = ' / '.join(links)
+    if previous_date:
+        nav += f' · <a href="../../{day_url(previous_date)}">← {previous_date}</a>'
+    if next_date:
+        nav += f' · <a href="../../{day_url(next_date)}">{next_date} →</a>'
+    return nav
+
+def render_indexes(records, output_dir):
+    """Write the month, year and front pages and search.json; returns pages written"""
+    months = {}
+    for record in records:
+        months.setdefault(record['date'][:7], []).append(record)
+    years = {}
+    for month in months:
+        years.setdefault(month[:4], []).append(month)
+
+    def entry(record, prefix):
+        icon = STATUS_ICONS.get(record['status'], "📝")
+        return (f'<li>{icon} <a href="{prefix}{record["url"]}">{html.escape(record["title"])}</a> '
+                f'({record["words"]} words)</li>')
+
+    def month_name(month):
+        return format_date_for_display(month + '-01').replace(' 01,', '')
+
+    written = 0
+    for month, month_records in months.items():
+        items = '\n'.join(entry(record, '../../') for record in reversed(month_records))
+        nav = f'<a href="../../index.html">Home</a> / <a href="../index.html">{month[:4]}</a>'
+        body = f'<h1>{html.escape(month_name(month))}</h1>\n<ul>\n{items}\n</ul>'
+        path = os.path.join(output_dir, month[:4], month[5:], 'index.html')
+        written += write_if_changed(path, render_page(month_name(month), body, nav, '../../'))
+
+    for year, year_months in years.items():
+        items = '\n'.join(f'<li><a href="{month[5:]}/index.html">{html.escape(month_name(month))}</a> '
+                          f'({len(months[month])} summaries)</li>' for month in sorted(year_months, reverse=True))
+        body = f'<h1>{year}</h1>\n<ul>\n{items}\n</ul>'
+        path = os.path.join(output_dir, year, 'index.html')
+        written += write_if_changed(path, render_page(year, body, '<a href="../index.html">Home</a>', '../'))
+
+    recent = '\n'.join(entry(record, '') for record in records[:-get_recent_count() - 1:-1])
+    year_items = '\n'.join(f'<li><a href="{year}/index.html">{year}</a> '
+                           f'({sum(len(months[month]) for month in year_months)} summaries)</li>'
+                           for year, year_months in sorted(years.items(), reverse=True))
+    body = (f'<h1>PhD Daily Summary</h1>\n<h2>Recent Summaries</h2>\n<ul>\n{recent}\n</ul>\n'
+            f'<h2>Archive</h2>\n<ul>\n{year_items}\n</ul>\n'
+            f'<footer>{len(records)} summaries · <a href="search.json">search.json</a></footer>')
+    written += write_if_changed(os.path.join(output_dir, 'index.html'),
+                                render_page('PhD Daily Summary', body, '', ''))
+    written += write_if_changed(os.path.join(output_dir, 'style.css'), STYLE)
+    written += write_if_changed(os.path.join(output_dir, 'search.json'),
+                                json.dumps(records, ensure_ascii=False, sort_keys=True) + '\n')
+    return written
+
+def remove_page(path):
+    """Delete a page whose summaries no longer exist; returns True if it existed"""
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+def build_site(output_dir=SITE_DIR, jobs=None, force=False):
+    """Bring the site up to date; returns (day pages rendered, pages removed, index pages written)"""
+    manifest = SummaryManifest()
+    start_date_str = get_setting('START_DATE')
+    shared = inputs_digest(start_date_str)
+    pages = {} if force else load_site_cache(output_dir)
+
+    days = []
+    for filepath in SummaryStore().list_files():
+        date_str = extract_date_from_filename(filepath)
+        if date_str:
+            days.append((date_str, filepath))
+
+    tasks = []
+    current = {}
+    for i, (date_str, filepath) in enumerate(days):
+        entry = manifest.get(filepath)
+        if entry is None:
+            continue
+        previous_date = days[i - 1][0] if i > 0 else None
+        next_date = days[i + 1][0] if i + 1 < len(days) else None
+        fingerprint = hashlib.sha256(f'{shared}\0{filepath}\0{entry["sha256"]}\0{previous_date}\0{next_date}'
+                                     .encode('utf-8')).hexdigest()
+        title = f"Daily Summary - {date_str}{calculate_day_counter(date_str, start_date_str)}"
+        record = {'date': date_str, 'url': day_url(date_str), 'title': title,
+                  'words': entry['word_count'], 'status': entry['status']}
+        page = pages.get(date_str)
+        output_path = os.path.join(output_dir, day_url(date_str))
+        if page and page['fingerprint'] == fingerprint and os.path.exists(output_path):
+            current[date_str] = page
+            continue
+        current[date_str] = {'fingerprint': fingerprint, 'record': record}
+        tasks.append((date_str, (filepath, output_path, title, day_nav(date_str, previous_date, next_date))))
+
+    task_args = [task for _date, task in tasks]
+    workers = jobs or os.cpu_count() or 1
+    with PROFILER.phase('render'):
+        if len(task_args) > 1 and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(render_day_page, task_args,
+                                            chunksize=max(1, len(task_args) // (4 * workers))))
+        else:
+            results = [render_day_page(task) for task in task_args]
+    for (date_str, _task), fields in zip(tasks, results):
+        current[date_str]['record'].update(fields)
+
+    removed = 0
+    for date_str in set(pages) - set(current):
+        removed += remove_page(os.path.join(output_dir, day_url(date_str)))
+    # Indexes of months and years that no longer have any summary
+    for old_month in {date_str[:7] for date_str in pages} - {date_str[:7] for date_str in current}:
+        removed += remove_page(os.path.join(output_dir, old_month[:4], old_month[5:], 'index.html'))
+    for old_year in {date_str[:4] for date_str in pages} - {date_str[:4] for date_str in current}:
+        removed += remove_page(os.path.join(output_dir, old_year, 'index.html'))
+
+    records = [current[date_str]['record'] for date_str, _filepath in days if date_str in current]
+    written = render_indexes(records, output_dir)
+
+    manifest.save()
+    write_if_changed(SITE_CACHE_PATH, json.dumps({'version': SITE_VERSION, 'output': output_dir, 'pages': current},
+                                                 indent=1, sort_keys=True) + '\n')
+    return len(tasks), removed, written
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a static HTML site of the daily summaries')
+    parser.add_argument('-o', '--output', default=SITE_DIR, help=f'Site directory (default: {SITE_DIR})')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument('--force', action='store_true', help='Render every page again')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    args = parser.parse_args()
+    setup_profiling('summary_site', args.profile)
+
+    rendered, removed, written = build_site(args.output, args.jobs, args.force)
+    if rendered or removed or written:
+        print(f"✅ Rendered {rendered} day pages, removed {removed}, updated {written} index files in {args.output}/")
+    else:
+        print(f"{args.output}/ is already up to date")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Rollup statistics per ISO week, month and year
+Usage: python summary_stats.py [--by week|month|year] [--last N]
+
+Running totals (summaries, filled days, words, completed tasks and the
+longest streak of filled days) are kept per period in
+.summary_cache/stats.json together with the contribution of every summary.
+When the contribution of a summary changes (its content, or its fill status
+after a template change) the old one is subtracted and the new one added,
+and only the streaks of the periods it belongs to are recomputed.
+Per-file fields come from the manifest, so unchanged files are never read.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+from summary_io import CACHE_DIR, write_if_changed
+from summary_manifest import SummaryManifest
+from summary_parser import extract_date_from_filename
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+
+STATS_PATH = os.path.join(CACHE_DIR, 'stats.json')
+STATS_VERSION = 3
+
+PERIODS = ('week', 'month', 'year')
+TOTALS = ('summaries', 'filled_days', 'words', 'tasks_done')
+
+def period_keys(day):
+    """{'week': '2025-W31', 'month': '2025-08', 'year': '2025'} for a date"""
+    iso_year, week, _ = day.isocalendar()
+    return {'week': f'{iso_year}-W{week:02d}', 'month': day.strftime('%Y-%m'), 'year': str(day.year)}
+
+def period_days(period, key):
+    """First and last day of a period"""
+    if period == 'week':
+        year, week = key.split('-W')
+        first = date.fromisocalendar(int(year), int(week), 1)
+        return first, first + timedelta(days=6)
+    if period == 'month':
+        first = date.fromisoformat(f'{key}-01')
+        return first, (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return date(int(key), 1, 1), date(int(key), 12, 31)
+
+def contribution(entry):
+    """What one summary adds to the totals of its periods"""
+    filled = bool(entry and entry.get('has_content'))
+    return {
+        'summaries': 1,
+        'filled_days': int(filled),
+        'words': entry.get('word_count', 0) if filled else 0,
+        'tasks_done': entry.get('tasks_done', 0) if entry else 0
+    }
+
+class RollupStats:
+    """Incrementally maintained per-period totals"""
+
+    def __init__(self, path=STATS_PATH):
+        self.path = path
+        self.days = {}
+        self.periods = {period: {} for period in PERIODS}
+        self.load()
+
+    def load(self):
+        """Load the totals from disk, ignoring missing or stale formats"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == STATS_VERSION:
+            self.days = data['days']
+            self.periods = data['periods']
+
+    def save(self):
+        """Write the totals back to disk if they changed"""
+        data = {'version': STATS_VERSION, 'days': self.days, 'periods': self.periods}
+        write_if_changed(self.path, json.dumps(data, indent=1, sort_keys=True) + '\n')
+
+    def _apply(self, date_str, totals, sign):
+        """Add (sign=1) or subtract (sign=-1) one day's totals; returns its periods"""
+        keys = period_keys(date.fromisoformat(date_str))
+        for period, key in keys.items():
+            row = self.periods[period].setdefault(key, dict.fromkeys(TOTALS + ('longest_streak',), 0))
+            for name in TOTALS:
+                row[name] += sign * totals[name]
+            if row['summaries'] == 0:
+                del self.periods[period][key]
+        return keys.items()
+
+    def update(self, summary_files, manifest):
+        """Bring the totals in line with the given summaries; returns periods updated"""
+        current = {}
+        for filepath in summary_files:
+            date_str = extract_date_from_filename(filepath)
+            if date_str:
+                current[date_str] = filepath
+
+        dirty = set()
+        for date_str in set(self.days) - set(current):
+            dirty.update(self._apply(date_str, self.days.pop(date_str)['totals'], -1))
+
+        for date_str, filepath in current.items():
+            entry = manifest.get(filepath)
+            if entry is None:
+                continue
+            known = self.days.get(date_str)
+            totals = contribution(entry)
+            # Compared by value: has_content and words also depend on template.md
+            if known and known['totals'] == totals:
+                continue
+            try:
+                if known:
+                    self._apply(date_str, known['totals'], -1)
+                dirty.update(self._apply(date_str, totals, 1))
+            except ValueError:
+                # Names like 2025-13-40.md match the pattern but are not dates
+                continue
+            self.days[date_str] = {'totals': totals}
+
+        with PROFILER.phase('aggregate'):
+            for period, key in dirty:
+                if key in self.periods[period]:
+                    self.periods[period][key]['longest_streak'] = self.longest_streak(period, key)
+        return len(dirty)
+
+    def longest_streak(self, period, key):
+        """Longest run of consecutive filled days inside one period"""
+        first, last = period_days(period, key)
+        longest = streak = 0
+        for offset in range((last - first).days + 1):
+            known = self.days.get((first + timedelta(days=offset)).isoformat())
+            streak = streak + 1 if known and known['totals']['filled_days'] else 0
+            longest = max(longest, streak)
+        return longest
+
+    def rows(self, period, last=None):
+        """Return [(key, totals)] for a period kind, oldest first"""
+        rows = sorted(self.periods[period].items())
+        return rows[-last:] if last else rows
+
+def load_stats(summary_files=None, manifest=None):
+    """Load the totals and update them for the current summaries"""
+    if manifest is None:
+        manifest = SummaryManifest()
+    if summary_files is None:
+        summary_files = SummaryStore().list_files()
+    stats = RollupStats()
+    stats.update(summary_files, manifest)
+    stats.save()
+    manifest.save()
+    return stats
+
+def format_table(rows, period):
+    """Format rollup rows as an aligned text table"""
+    lines = [f"{period.capitalize():<10} {'summaries':>9} {'filled':>7} {'words':>8} {'tasks':>6} {'streak':>7}"]
+    for key, row in rows:
+        lines.append(f"{key:<10} {row['summaries']:>9} {row['filled_days']:>7} {row['words']:>8} "
+                     f"{row['tasks_done']:>6} {row['longest_streak']:>7}")
+    return '\n'.join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='Weekly, monthly and yearly statistics of the daily summaries')
+    parser.add_argument('--by', choices=PERIODS, default='month', help='Grouping (default: month)')
+    parser.add_argument('--last', type=int, metavar='N', help='Only show the N most recent periods')
+    parser.add_argument('--json', action='store_true', help='Print the rows as JSON')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    args = parser.parse_args()
+    setup_profiling('summary_stats', args.profile)
+
+    rows = load_stats().rows(args.by, args.last)
+    if not rows:
+        print("No summaries found.")
+        sys.exit(1)
+    if args.json:
+        print(json.dumps([dict(row, period=key) for key, row in rows], indent=2, sort_keys=True))
+    else:
+        print(format_table(rows, args.by))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Storage layout of the Summary directory
+Usage: python summary_storage.py migrate --layout sharded [--dry-run]
+
+Two layouts are supported and can coexist while migrating:
+    flat      Summary/2025-08-03.md
+    sharded   Summary/2025/08/2025-08-03.md
+
+The layout used for new files is SUMMARY_LAYOUT in config.py; if it is not
+set, "sharded" is used as soon as a year directory exists, else "flat".
+Listing always finds files in both layouts, and date-range listings only
+open the year/month shards inside the range.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from summary_config import get_setting
+from summary_parser import FILENAME_DATE_RE
+from summary_profile import PROFILER
+
+SUMMARY_DIR = 'Summary'
+LAYOUTS = ('flat', 'sharded')
+
+YEAR_RE = re.compile(r'^\d{4}$')
+MONTH_RE = re.compile(r'^\d{2}$')
+
+def configured_layout():
+    """SUMMARY_LAYOUT from config.py, or None"""
+    layout = get_setting('SUMMARY_LAYOUT')
+    return layout if layout in LAYOUTS else None
+
+class SummaryStore:
+    """Locates summary files for dates in either layout"""
+
+    def __init__(self, root=None, layout=None):
+        self.root = root
+        self.summary_dir = os.path.join(root, SUMMARY_DIR) if root else SUMMARY_DIR
+        self._layout = layout
+
+    @property
+    def layout(self):
+        """Layout for new files (resolved on first use)"""
+        if self._layout is None:
+            self._layout = configured_layout() or self.detect_layout()
+        return self._layout
+
+    def detect_layout(self):
+        """'sharded' if any year directory exists, else 'flat'"""
+        try:
+            with os.scandir(self.summary_dir) as entries:
+                for entry in entries:
+                    if YEAR_RE.match(entry.name) and entry.is_dir():
+                        return 'sharded'
+        except OSError:
+            pass
+        return 'flat'
+
+    def path_for(self, date_str, layout=None):
+        """Path of the summary for a date in the given (default: current) layout"""
+        if (layout or self.layout) == 'sharded':
+            return os.path.join(self.summary_dir, date_str[:4], date_str[5:7], f'{date_str}.md')
+        return os.path.join(self.summary_dir, f'{date_str}.md')
+
+    def find(self, date_str):
+        """Path of the existing summary for a date in any layout, or None"""
+        for layout in LAYOUTS:
+            path = self.path_for(date_str, layout)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def iter_files(self, start=None, end=None):
+        """Yield summary paths, optionally limited to dates in [start, end]
+
+        start and end are 'YYYY-MM-DD' strings. Only the year and month
+        directories overlapping the range are scanned.
+        """
+        try:
+            top = os.scandir(self.summary_dir)
+        except OSError:
+            return
+        shards = []
+        with top:
+            for entry in top:
+                if entry.name.endswith('.md'):
+                    if self._in_range(entry.name[:10], start, end) and FILENAME_DATE_RE.match(entry.name):
+                        yield entry.path
+                elif YEAR_RE.match(entry.name) and self._in_range(entry.name, start[:4] if start else None,
+                                                                   end[:4] if end else None):
+                    shards.append(entry.path)
+
+        for year_path in shards:
+            year = os.path.basename(year_path)
+            try:
+                months = os.scandir(year_path)
+            except OSError:
+                continue
+            with months:
+                month_paths = [entry.path for entry in months
+                               if MONTH_RE.match(entry.name)
+                               and self._in_range(f'{year}-{entry.name}', start[:7] if start else None,
+                                                  end[:7] if end else None)]
+            for month_path in month_paths:
+                try:
+                    files = os.scandir(month_path)
+                except OSError:
+                    continue
+                with files:
+                    for entry in files:
+                        if FILENAME_DATE_RE.match(entry.name) and self._in_range(entry.name[:10], start, end):
+                            yield entry.path
+
+    def list_files(self, start=None, end=None, sort=True):
+        """Return summary paths sorted by date (oldest first)
+
+        With sort=False they are returned in directory order, for callers
+        that only aggregate over all files.
+        """
+        with PROFILER.phase('scan'):
+            files = list(self.iter_files(start, end))
+            if sort:
+                files.sort(key=os.path.basename)
+        PROFILER.count('files_scanned', len(files))
+        return files
+
+    @staticmethod
+    def _in_range(key, start, end):
+        """Compare a date prefix ('YYYY', 'YYYY-MM' or a full date) with a range"""
+        return (start is None or key >= start) and (end is None or key <= end)
+
+    def migrate(self, layout, dry_run=False):
+        """Move every summary into the given layout; returns [(old, new)] moves"""
+        moves = []
+        for path in self.list_files():
+            date_str = FILENAME_DATE_RE.match(os.path.basename(path)).group(1)
+            target = self.path_for(date_str, layout)
+            if os.path.normpath(path) == os.path.normpath(target):
+                continue
+            if os.path.exists(target):
+                print(f"Warning: '{target}' already exists. Skipping '{path}'.")
+                continue
+            moves.append((path, target))
+            if not dry_run:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.rename(path, target)
+
+        if not dry_run:
+            self._remove_empty_shards()
+            self._layout = layout
+        return moves
+
+    def _remove_empty_shards(self):
+        """Remove year/month directories left empty by a migration"""
+        for dirpath, _dirnames, _filenames in os.walk(self.summary_dir, topdown=False):
+            if dirpath != self.summary_dir and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the layout of the Summary directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    migrate = subparsers.add_parser('migrate', help='Move all summaries into a layout')
+    migrate.add_argument('--layout', choices=LAYOUTS, required=True, help='Target layout')
+    migrate.add_argument('--dry-run', action='store_true', help='Only show what would be moved')
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        store = SummaryStore()
+        moves = store.migrate(args.layout, args.dry_run)
+        for old, new in moves:
+            print(f"{old} → {new}")
+        action = "would be moved" if args.dry_run else "moved"
+        print(f"\n✅ {len(moves)} summaries {action} to the {args.layout} layout.")
+        if not args.dry_run and moves and configured_layout() not in (None, args.layout):
+            print(f"⚠️  config.py still sets SUMMARY_LAYOUT = \"{configured_layout()}\"; "
+                  f"update it to \"{args.layout}\".")
+        sys.exit(0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Task records extracted from the checkboxes of daily summaries
+Usage: python summary_tasks.py completion [--by week|month|year]
+       python summary_tasks.py unfinished-plans [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+
+Every '- [ ]' / '- [x]' item is stored as a record (date, section, text,
+checked) in .summary_cache/tasks.sqlite. The cache is updated incrementally
+before each query, so queries never re-parse unchanged markdown.
+Items copied unchanged from template.md ("Task 1", "Plan 1", ...) are ignored.
+"""
+
+import argparse
+import os
+import sys
+from datetime import date
+
+from summary_index import open_database, sync_documents
+from summary_io import CACHE_DIR
+from summary_parser import COMPLETED_SECTION, PLAN_SECTION, iter_checkboxes, normalize_item
+from summary_profile import PROFILER, setup_profiling
+from summary_storage import SummaryStore
+
+CACHE_PATH = os.path.join(CACHE_DIR, 'tasks.sqlite')
+CACHE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    doc INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    week TEXT NOT NULL,
+    section TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    norm TEXT NOT NULL,
+    checked INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_doc ON tasks (doc);
+CREATE INDEX IF NOT EXISTS tasks_section ON tasks (section, date);
+CREATE INDEX IF NOT EXISTS tasks_norm ON tasks (norm, section, checked, date);
+"""
+
+PERIODS = {
+    'week': "week",
+    'month': "substr(date, 1, 7)",
+    'year': "substr(date, 1, 4)"
+}
+
+def iso_week(date_str):
+    """'2025-08-03' -> '2025-W31'"""
+    iso_year, week, _ = date.fromisoformat(date_str).isocalendar()
+    return f'{iso_year}-W{week:02d}'
+
+def open_cache(path=CACHE_PATH):
+    """Open (and create if needed) the task cache"""
+    return open_database(path, SCHEMA, CACHE_VERSION)
+
+def iter_task_records(filepath, date_str, doc_id=None):
+    """Yield task rows for one summary file, streaming its lines"""
+    try:
+        week = iso_week(date_str)
+    except ValueError:
+        # Names like 2025-13-40.md match the pattern but are not dates
+        return
+    with PROFILER.phase('read'):
+        f = open(filepath, 'r', encoding='utf-8')
+    PROFILER.count('files_read')
+    with f, PROFILER.phase('parse'):
+        for section, line_number, text, checked in iter_checkboxes(f):
+            yield doc_id, date_str, week, section, line_number, text, normalize_item(text), int(checked)
+
+def update_cache(conn, summary_files):
+    """Re-parse changed summaries and drop deleted ones; returns files re-parsed"""
+    def index_document(conn, doc_id, filepath, date_str):
+        conn.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         list(iter_task_records(filepath, date_str, doc_id)))
+
+    return sync_documents(conn, summary_files, ('tasks',), index_document)
+
+def template_items(template_path='template.md'):
+    """Normalized texts of the placeholder items in the template"""
+    try:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            return sorted({normalize_item(text) for _section, _line, text, _checked in iter_checkboxes(f)})
+    except OSError:
+        return []
+
+def _not_placeholder(alias, placeholders):
+    """SQL condition (and params) excluding template placeholder items"""
+    if not placeholders:
+        return "1", []
+    marks = ', '.join('?' * len(placeholders))
+    return f"{alias}.norm NOT IN ({marks})", list(placeholders)
+
+def completion_ratio(conn, by='week', placeholders=()):
+    """Return [(period, checked, total)] for "Today's Completed Work" items"""
+    condition, params = _not_placeholder('t', placeholders)
+    sql = (f"SELECT {PERIODS[by]} AS period, SUM(checked), COUNT(*) FROM tasks t "
+           f"WHERE section = ? AND {condition} GROUP BY period ORDER BY period")
+    return conn.execute(sql, [COMPLETED_SECTION] + params).fetchall()
+
+def unfinished_plans(conn, date_from=None, date_to=None, placeholders=()):
+    """Return [(date, text)] of planned items that were never checked off
+
+    A plan counts as carried out if it is checked in the plan itself or if
+    the same item appears checked under "Today's Completed Work" on a later
+    day.
+    """
+    condition, params = _not_placeholder('p', placeholders)
+    where = ["p.section = ?", "p.checked = 0", condition]
+    params = [PLAN_SECTION] + params
+    if date_from:
+        where.append("p.date >= ?")
+        params.append(date_from)
+    if date_to:
+        where.append("p.date <= ?")
+        params.append(date_to)
+    sql = (f"SELECT p.date, p.text FROM tasks p WHERE {' AND '.join(where)} "
+           f"AND NOT EXISTS (SELECT 1 FROM tasks t WHERE t.norm = p.norm AND t.section = ? "
+           f"AND t.checked = 1 AND t.date > p.date) ORDER BY p.date, p.line")
+    return conn.execute(sql, params + [COMPLETED_SECTION]).fetchall()
+
+def main():
+    parser = argparse.ArgumentParser(description='Query tasks and plans from daily summaries')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    completion = subparsers.add_parser('completion', help='Completion ratio of completed-work items')
+    completion.add_argument('--by', choices=sorted(PERIODS), default='week', help='Grouping (default: week)')
+
+    plans = subparsers.add_parser('unfinished-plans', help='Planned items that were never carried out')
+    plans.add_argument('--from', dest='date_from', metavar='YYYY-MM-DD', help='Earliest plan date')
+    plans.add_argument('--to', dest='date_to', metavar='YYYY-MM-DD', help='Latest plan date')
+
+    args = parser.parse_args()
+    setup_profiling('summary_tasks', args.profile)
+
+    conn = open_cache()
+    update_cache(conn, SummaryStore().list_files())
+    placeholders = template_items()
+
+    if args.command == 'completion':
+        rows = completion_ratio(conn, args.by, placeholders)
+        if not rows:
+            print("No completed-work items found.")
+            sys.exit(1)
+        print(f"{args.by.capitalize():<10} {'done':>6} {'total':>6} {'ratio':>7}")
+        for period, checked, total in rows:
+            print(f"{period:<10} {checked:>6} {total:>6} {checked / total:>7.0%}")
+
+    elif args.command == 'unfinished-plans':
+        rows = unfinished_plans(conn, args.date_from, args.date_to, placeholders)
+        if not rows:
+            print("🎉 Every plan was carried out.")
+            return
+        for date_str, text in rows:
+            print(f"{date_str}  - [ ] {text}")
+        print(f"\n{len(rows)} plans never carried out.")
+
+if __name__ == '__main__':
+    main()
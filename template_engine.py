@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Minimal template engine for daily summary files
+The template is parsed once into literal and placeholder segments, so
+rendering a date is a single join instead of one str.replace per variable.
+Compiled templates are cached per path and reused until the file changes.
+
+Supported variables:
+    {{DATE}}              2025-08-03
+    {{DATETIME}}          2025-08-03 00:00:00
+    {{DAY_COUNTER}}       " [Day 34]" when a start date is configured
+    {{WEEKDAY}}           Sunday
+    {{ISO_WEEK}}          2025-W31
+    {{DAYS_TO_DEADLINE}}  days left until config.DEADLINE (empty if unset)
+    {{PREVIOUS_PLAN}}     the "Tomorrow's Plan" items of the previous day
+"""
+
+import hashlib
+import os
+import re
+from datetime import datetime, timedelta
+
+from summary_config import get_setting, virtual_day_counters
+from summary_parser import PLAN_SECTION, extract_section, iter_sections
+from summary_profile import PROFILER
+from summary_storage import SummaryStore
+
+PLACEHOLDER_RE = re.compile(r'\{\{([A-Z_]+)\}\}')
+
+class CompiledTemplate:
+    """A template split into alternating literal and placeholder segments"""
+
+    def __init__(self, text):
+        self.text = text
+        # Even indices are literals, odd indices are placeholder names
+        self.segments = PLACEHOLDER_RE.split(text)
+        self.placeholders = set(self.segments[1::2])
+
+    def render(self, variables):
+        """Render the template; unknown placeholders are left untouched"""
+        parts = list(self.segments)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = variables[name] if name in variables else '{{' + name + '}}'
+        return ''.join(parts)
+
+def compile_template(text):
+    """Compile template text"""
+    return CompiledTemplate(text)
+
+# path -> (size, mtime_ns, sha256, CompiledTemplate)
+_template_cache = {}
+
+def get_template(template_path='template.md'):
+    """Return the compiled template, recompiling only when the file changed"""
+    st = os.stat(template_path)
+    key = os.path.abspath(template_path)
+    cached = _template_cache.get(key)
+    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[3]
+
+    with PROFILER.phase('read'):
+        with open(template_path, 'rb') as f:
+            data = f.read()
+    PROFILER.count('bytes_read', len(data))
+    digest = hashlib.sha256(data).hexdigest()
+    if cached and cached[2] == digest:
+        # Touched but not modified
+        compiled = cached[3]
+    else:
+        compiled = compile_template(data.decode('utf-8').replace('\r\n', '\n'))
+    _template_cache[key] = (st.st_size, st.st_mtime_ns, digest, compiled)
+    return compiled
+
+def template_digest(template_path='template.md'):
+    """sha256 of the template file (as cached by get_template)"""
+    get_template(template_path)
+    return _template_cache[os.path.abspath(template_path)][2]
+
+def parse_start_date(start_date_str, label='start date'):
+    """Parse a YYYY-MM-DD setting, returning None if unset or invalid"""
+    if not start_date_str:
+        return None
+    try:
+        return datetime.strptime(start_date_str, '%Y-%m-%d')
+    except ValueError:
+        print(f"Warning: Invalid {label} format. Please use YYYY-MM-DD format.")
+        return None
+
+def previous_plan(target_date, store=None):
+    """Return the "Tomorrow's Plan" section of the previous day's summary"""
+    previous = (target_date - timedelta(days=1)).strftime('%Y-%m-%d')
+    path = (store or SummaryStore()).find(previous)
+    if path is None:
+        return ""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except OSError:
+        return ""
+    return extract_section(content, PLAN_SECTION)
+
+def summary_variables(target_date, start_date=None, deadline=None, needed=None, plan=None):
+    """Build the template variables for a date
+    
+    needed is the set of placeholders used by the template; variables that
+    are expensive to compute (such as PREVIOUS_PLAN) are skipped if unused.
+    plan is the previous day's plan if the caller already has it (e.g. it
+    rendered that day itself); otherwise it is read from the previous summary.
+    """
+    day_counter = ""
+    # In virtual mode the counter is computed when rendering the README instead
+    if start_date is not None and not virtual_day_counters():
+        days_diff = (target_date - start_date).days
+        if days_diff >= 0:
+            day_counter = f" [Day {days_diff + 1}]"
+
+    iso_year, iso_week, _ = target_date.isocalendar()
+    variables = {
+        'DATE': target_date.strftime('%Y-%m-%d'),
+        'DATETIME': target_date.strftime('%Y-%m-%d %H:%M:%S'),
+        'DAY_COUNTER': day_counter,
+        'WEEKDAY': target_date.strftime('%A'),
+        'ISO_WEEK': f'{iso_year}-W{iso_week:02d}',
+        'DAYS_TO_DEADLINE': ''
+    }
+
+    if deadline is not None:
+        variables['DAYS_TO_DEADLINE'] = str((deadline.date() - target_date.date()).days)
+
+    if plan is not None:
+        variables['PREVIOUS_PLAN'] = plan
+    elif needed is None or 'PREVIOUS_PLAN' in needed:
+        variables['PREVIOUS_PLAN'] = previous_plan(target_date)
+
+    return variables
+
+# Fill states of a summary compared to its rendered template
+UNTOUCHED = 'untouched'
+PARTIAL = 'partial'
+FILLED = 'filled'
+
+# Stands in for {{PREVIOUS_PLAN}} to find the sections it is rendered into
+PLAN_MARKER = '\0PREVIOUS_PLAN\0'
+
+def section_bodies(lines):
+    """Return {section: body with whitespace collapsed}"""
+    bodies = {}
+    for section, _line_number, line in iter_sections(lines):
+        bodies.setdefault(section, []).append(line)
+    return {section: ' '.join(' '.join(body).split()) for section, body in bodies.items()}
+
+class TemplateFingerprint:
+    """Renders the template per date to tell untouched summaries from filled ones
+
+    Sections holding {{PREVIOUS_PLAN}} depend on another summary, so they
+    are not compared: classifying a summary never reads a second file, and
+    its status does not change when the previous day is edited.
+    """
+
+    def __init__(self, template_path='template.md'):
+        self.template = get_template(template_path)
+        self.digest = template_digest(template_path)
+        self.start_date = parse_start_date(get_setting('START_DATE'))
+        self.deadline = parse_start_date(get_setting('DEADLINE'), 'deadline')
+        self.wildcards = set()
+        if 'PREVIOUS_PLAN' in self.template.placeholders:
+            marked = self.template.render({'PREVIOUS_PLAN': PLAN_MARKER})
+            self.wildcards = {section for section, body in section_bodies(marked.split('\n')).items()
+                              if PLAN_MARKER in body}
+
+    def render(self, date_str):
+        """The content a freshly created summary for date_str would have
+
+        {{PREVIOUS_PLAN}} is rendered empty (see the class docstring).
+        """
+        target_date = datetime.strptime(date_str, '%Y-%m-%d')
+        variables = summary_variables(target_date, self.start_date, self.deadline, self.template.placeholders,
+                                      plan='')
+        return self.template.render(variables)
+
+    def classify(self, content, size, sha256, date_str):
+        """Return UNTOUCHED, PARTIAL or FILLED (None if date_str is not a date)
+
+        A summary identical to the rendered template (same size, then same
+        hash) is untouched. Otherwise the sections are compared: a summary
+        is filled once at least half of the template sections were edited.
+        Title and footer are ignored, so a changed day counter or creation
+        time does not count as content.
+        """
+        try:
+            rendered = self.render(date_str)
+        except ValueError:
+            return None
+        encoded = rendered.encode('utf-8')
+        if len(encoded) == size and hashlib.sha256(encoded).hexdigest() == sha256:
+            return UNTOUCHED
+
+        expected = {section: body for section, body in section_bodies(rendered.split('\n')).items()
+                    if section not in self.wildcards}
+        actual = {section: body for section, body in section_bodies(content.split('\n')).items()
+                  if section not in self.wildcards}
+        changed = sum(1 for section, body in expected.items() if actual.get(section, '') != body)
+        changed += sum(1 for section, body in actual.items() if section not in expected and body)
+        if changed == 0:
+            return UNTOUCHED
+        return FILLED if changed * 2 >= len(expected) else PARTIAL
@@ -0,0 +1,59 @@
+"""
+Shared fixtures: a small summary repository in a temporary directory
+The scripts work on paths relative to the repository root, so the fixture
+changes into it; the modules themselves are imported from this checkout.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, '.github', 'scripts')]
+
+from create_missing_summaries import create_summaries_batch
+from summary_config import reload_config
+
+DATES = ['2025-08-02', '2025-08-03', '2025-08-04']
+
+def git(*args):
+    """Run git in the current directory and return its output"""
+    return subprocess.run(['git', *args], check=True, capture_output=True, text=True).stdout.strip()
+
+def commit(message):
+    git('add', '-A')
+    git('commit', '-q', '-m', message)
+
+def write(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A committed summary repository with three untouched summaries"""
+    for name, value in (('NAME', 'Test'), ('EMAIL', 'test@example.com')):
+        monkeypatch.setenv(f'GIT_AUTHOR_{name}', value)
+        monkeypatch.setenv(f'GIT_COMMITTER_{name}', value)
+    for name in ('START_DATE', 'DAY_COUNTER_MODE', 'SUMMARY_LAYOUT', 'RECENT_SUMMARIES'):
+        monkeypatch.delenv(name, raising=False)
+
+    root = tmp_path / 'repo'
+    root.mkdir()
+    monkeypatch.chdir(root)
+    shutil.copy(os.path.join(ROOT, 'template.md'), 'template.md')
+    write('config.py', 'START_DATE = "2025-07-01"\n')
+    write('.gitignore', '.summary_cache/\n')
+    reload_config()
+    create_summaries_batch(DATES)
+
+    git('init', '-q')
+    commit('Add summaries')
+    yield root
+    reload_config()
@@ -0,0 +1,146 @@
+"""
+Cache invalidation of the README pipeline
+Every test runs the pipeline in the repository of the `repo` fixture and
+compares the result of incremental runs with what a run without any cache
+produces.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+from conftest import DATES, ROOT, commit, git, read, write
+from create_missing_summaries import create_summaries_batch
+from git_changes import changes_from_args
+from summary_io import CACHE_DIR
+from summary_manifest import SummaryManifest
+from summary_pipeline import run_pipeline
+from summary_stats import RollupStats
+from template_engine import UNTOUCHED
+
+def run(since=None, paths=None, incremental=False):
+    """Run the pipeline like summary_pipeline.py; returns its manifest"""
+    manifest = SummaryManifest()
+    args = argparse.Namespace(since=since, paths=paths, incremental=incremental)
+    assert run_pipeline(changes_from_args(args, manifest), manifest) is not False
+    return manifest
+
+def script(name, *args):
+    """Run one of the CI scripts on its own, in a fresh process"""
+    subprocess.run([sys.executable, os.path.join(ROOT, '.github', 'scripts', name), *args],
+                   check=True, capture_output=True)
+
+def outputs():
+    """README and archive pages, the files a cache must not change"""
+    files = {'README.md': read('README.md')}
+    for name in sorted(os.listdir('Archive')):
+        files[name] = read(os.path.join('Archive', name))
+    return files
+
+def cold_outputs():
+    """The outputs of a run without any cache"""
+    shutil.rmtree(CACHE_DIR)
+    run()
+    return outputs()
+
+def test_template_change_updates_manifest_stats_and_archive(repo):
+    run()
+    assert '📄' in read('Archive/2025-08.md')
+    assert all(entry['status'] == UNTOUCHED for entry in SummaryManifest().entries.values())
+
+    # The summaries no longer match the template, so they count as edited
+    write('template.md', read('template.md').replace('Task 1', 'Item 1'))
+    run(paths=['template.md'])
+
+    assert all(entry['status'] != UNTOUCHED for entry in SummaryManifest().entries.values())
+    month = dict(RollupStats().rows('month'))['2025-08']
+    assert month['filled_days'] == len(DATES) and month['words'] > 0
+    assert '📄' not in read('Archive/2025-08.md')
+
+    incremental = outputs()
+    assert incremental == cold_outputs()
+
+def test_fresh_checkout_reads_only_changed_files(repo, tmp_path, monkeypatch):
+    run()
+    commit('Update README')
+
+    # CI: a new clone (every file gets a new mtime) with the cache restored
+    clone = tmp_path / 'clone'
+    git('clone', '-q', str(repo), str(clone))
+    shutil.copytree(repo / CACHE_DIR, clone / CACHE_DIR)
+    monkeypatch.chdir(clone)
+
+    with open('Summary/2025-08-03.md', 'a', encoding='utf-8') as f:
+        f.write('\nFinished the literature review.\n')
+    commit('Edit one summary')
+
+    manifest = run(incremental=True)
+    assert manifest.files_read == 1
+
+    incremental = outputs()
+    assert incremental == cold_outputs()
+
+def test_since_with_stale_listing(repo):
+    run()
+    commit('Update README')
+
+    # Two pushes, but the run for the first one never saved its cache
+    create_summaries_batch(['2025-08-05'])
+    commit('Add 2025-08-05')
+    create_summaries_batch(['2025-08-06'])
+    commit('Add 2025-08-06')
+
+    manifest = run(since='HEAD~1')
+    assert 'Summary/2025-08-05.md' in manifest.listing
+    assert 'Summary/2025-08-05.md' in read('README.md')
+
+    incremental = outputs()
+    assert incremental == cold_outputs()
+
+def test_paths_run_keeps_the_revision_of_the_listing(repo):
+    run()
+    commit('Update README')
+
+    # 2025-08-05 is committed but never processed; a --paths run (or watch
+    # mode) then only looks at 2025-08-06
+    create_summaries_batch(['2025-08-05'])
+    commit('Add 2025-08-05')
+    create_summaries_batch(['2025-08-06'])
+    commit('Add 2025-08-06')
+    script('update_readme.py', '--paths', 'Summary/2025-08-06.md')
+
+    manifest = run(incremental=True)
+    assert 'Summary/2025-08-05.md' in manifest.listing
+    assert '2025-08-05' not in read('README.md').split('Missing Summaries')[-1]
+
+    incremental = outputs()
+    assert incremental == cold_outputs()
+
+def test_fix_only_run_leaves_the_range_to_the_readme_run(repo):
+    run()
+    commit('Update README')
+
+    create_summaries_batch(['2025-09-03'])
+    commit('Add 2025-09-03')
+    # The two-step flow: counters first, then README and archive
+    script('fix_day_counters.py', '--incremental')
+    script('update_readme.py', '--incremental')
+
+    assert os.path.exists('Archive/2025-09.md')
+    assert '*4 summaries' in read('Archive/2025.md')
+
+    incremental = outputs()
+    assert incremental == cold_outputs()
+
+def test_listing_from_another_branch_forces_full_rebuild(repo):
+    run()
+    # e.g. after a force push: the manifest's commit is not an ancestor of HEAD
+    git('checkout', '-q', '--orphan', 'rewritten')
+    create_summaries_batch(['2025-08-05'])
+    commit('Rewritten history')
+
+    manifest = run(incremental=True)
+    assert 'Summary/2025-08-05.md' in manifest.listing
+    assert manifest.revision == git('rev-parse', 'HEAD')
@@ -0,0 +1,25 @@
+"""
+Streaming export to a pipe
+"""
+
+import os
+import subprocess
+import sys
+from datetime import date, timedelta
+
+from conftest import ROOT
+from create_missing_summaries import create_summaries_batch
+
+def test_closed_pipe_ends_the_export_quietly(repo):
+    # More than a pipe buffer of records
+    create_summaries_batch([(date(2024, 1, 1) + timedelta(days=offset)).isoformat() for offset in range(400)])
+
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, 'summary_export.py')],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    first = proc.stdout.readline()
+    proc.stdout.close()
+    stderr = proc.stderr.read().decode('utf-8')
+    proc.wait()
+
+    assert first.startswith(b'{"date": "2024-01-01"')
+    assert 'Traceback' not in stderr and 'BrokenPipeError' not in stderr
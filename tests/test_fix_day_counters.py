@@ -0,0 +1,42 @@
+"""
+The JSON report of fix_day_counters.py, as read by CI steps
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from conftest import DATES, ROOT, commit, write
+
+SCRIPTS = os.path.join(ROOT, '.github', 'scripts')
+
+def script(name, *args):
+    """Run a CI script in a fresh process; returns the CompletedProcess"""
+    return subprocess.run([sys.executable, os.path.join(SCRIPTS, name), *args],
+                          capture_output=True, text=True)
+
+def test_report_on_stdout_is_the_only_output(repo):
+    proc = script('fix_day_counters.py', '--json', '-')
+    assert proc.returncode == 0
+    report = json.loads(proc.stdout)
+    assert report['files_checked'] == len(DATES) and report['skipped'] is None
+    assert 'Validating' in proc.stderr
+
+def test_report_when_nothing_changed(repo):
+    script('summary_pipeline.py')
+    commit('Update README')
+
+    proc = script('fix_day_counters.py', '--incremental', '--json', 'report.json')
+    assert proc.returncode == 0
+    with open('report.json', 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['files_checked'] == 0 and report['skipped'] == 'no_changed_files'
+    assert report['success'] is True
+
+def test_report_without_start_date(repo):
+    write('config.py', '# No START_DATE\n')
+    proc = script('fix_day_counters.py', '--json', '-')
+    report = json.loads(proc.stdout)
+    assert report['files_checked'] == 0 and report['skipped'] == 'no_start_date'
+    assert report['success'] is (proc.returncode == 0)
@@ -0,0 +1,61 @@
+"""
+Rendering and classifying summaries with template variables
+"""
+
+import shutil
+from datetime import date, timedelta
+
+import pytest
+
+import template_engine
+from conftest import DATES, read, write
+from create_missing_summaries import create_summaries_batch
+from summary_manifest import SummaryManifest
+from summary_parser import PLAN_SECTION, extract_section
+from template_engine import PARTIAL, UNTOUCHED
+
+PLAN_TEMPLATE_SECTION = "\n## Yesterday's Plan\n\n{{PREVIOUS_PLAN}}\n"
+
+@pytest.fixture
+def plan_repo(repo):
+    """The repository with {{PREVIOUS_PLAN}} in the template and fresh summaries"""
+    write('template.md', read('template.md') + PLAN_TEMPLATE_SECTION)
+    shutil.rmtree('Summary')
+    create_summaries_batch(DATES)
+    return repo
+
+def statuses(manifest_path):
+    manifest = SummaryManifest(path=manifest_path)
+    result = {date_str: manifest.get(f'Summary/{date_str}.md')['status'] for date_str in DATES}
+    manifest.save()
+    return result
+
+def test_classifying_never_reads_the_previous_day(plan_repo, monkeypatch):
+    def previous_plan(*args, **kwargs):
+        raise AssertionError('classification read the previous summary')
+    monkeypatch.setattr(template_engine, 'previous_plan', previous_plan)
+
+    assert statuses('warm.json') == dict.fromkeys(DATES, UNTOUCHED)
+
+    # Editing the plan of the first day changes what the second one would be
+    # rendered with today, but not whether it was edited
+    first = f'Summary/{DATES[0]}.md'
+    write(first, read(first).replace('- [ ] Plan 1', '- [ ] Write the methods chapter'))
+    cold = statuses('cold.json')
+    assert cold == {DATES[0]: PARTIAL, DATES[1]: UNTOUCHED, DATES[2]: UNTOUCHED}
+    assert statuses('warm.json') == cold
+
+def test_backfill_carries_each_plan_to_the_next_day(plan_repo):
+    last = f'Summary/{DATES[-1]}.md'
+    write(last, read(last).replace('- [ ] Plan 1', '- [ ] Draft chapter 2'))
+
+    # Every day is created in this batch, after the day it takes its plan from
+    # (a long range: with threads reading the previous file this went wrong
+    # for a few days in most runs)
+    dates = [(date(2025, 8, 5) + timedelta(days=offset)).isoformat() for offset in range(120)]
+    assert create_summaries_batch(dates, jobs=8) == [(date_str, 'created') for date_str in dates]
+
+    assert 'Draft chapter 2' in extract_section(read('Summary/2025-08-05.md'), "Yesterday's Plan")
+    for previous, date_str in zip([DATES[-1]] + dates, dates):
+        expected = extract_section(read(f'Summary/{previous}.md'), PLAN_SECTION)
+        assert extract_section(read(f'Summary/{date_str}.md'), "Yesterday's Plan") == expected
@@ -12,21 +12,24 @@ sys.path.append(os.path.dirname(__file__))
 
 # Import the validation function
 sys.path.append(os.path.join(os.path.dirname(__file__), '.github', 'scripts'))
-from fix_day_counters import validate_and_fix_day_counters
+from fix_day_counters import parse_args, report_output, run_with_args
+from summary_profile import setup_profiling
 
 def main():
     """Main function for standalone execution"""
-    print("🔍 Day Counter Validation Tool")
-    print("=" * 40)
-    
-    success = validate_and_fix_day_counters()
-    
-    if success:
-        print("\n🎉 Validation completed successfully!")
-        sys.exit(0)
-    else:
-        print("\n❌ Validation completed with errors.")
-        sys.exit(1)
+    args = parse_args()
+    setup_profiling('validate_day_counters', args.profile)
+    with report_output(args):
+        print("🔍 Day Counter Validation Tool")
+        print("=" * 40)
+        
+        success = run_with_args(args)
+        
+        if success:
+            print("\n🎉 Validation completed successfully!")
+        else:
+            print("\n❌ Validation completed with errors.")
+    sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
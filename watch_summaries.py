@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Watch mode: keep README.md and day counters up to date while you edit
+Usage: python watch_summaries.py [--debounce 0.5] [--poll] [--interval 1.0]
+
+Watches Summary/, config.py and template.md (inotify on Linux, polling
+elsewhere). After a burst of saves settles, only the affected summaries are
+re-checked and the README is regenerated, reusing the parsed manifest kept
+in memory. A change to config.py or template.md triggers a full run.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.github', 'scripts'))
+from git_changes import ChangeSet, detect_changes
+from summary_config import reload_config
+from summary_manifest import SummaryManifest
+from summary_pipeline import run_pipeline
+from summary_profile import setup_profiling
+from summary_storage import SUMMARY_DIR, SummaryStore
+
+WATCHED_FILES = ('config.py', 'template.md')
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+class InotifyWatcher:
+    """Directory watcher built on Linux inotify (through ctypes)"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.directories = {}
+        self.add_directory('.')
+        self.add_tree(SUMMARY_DIR)
+
+    def add_directory(self, path):
+        """Start watching one directory"""
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {path}')
+        self.directories[wd] = path
+
+    def add_tree(self, root):
+        """Watch a directory and all its subdirectories (year/month shards)"""
+        for dirpath, _dirnames, _filenames in os.walk(root):
+            self.add_directory(dirpath)
+
+    def wait(self, timeout=None):
+        """Return the set of changed paths, an empty set on timeout, or None on overflow"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+            directory = self.directories.get(wd)
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+                continue
+            if directory is None or not name:
+                continue
+
+            path = os.path.normpath(os.path.join(directory, os.fsdecode(name)))
+            if mask & IN_ISDIR:
+                # A new Summary/ or year/month shard: watch it and pick up
+                # files that were written before the watch existed
+                if mask & (IN_CREATE | IN_MOVED_TO) and (path == SUMMARY_DIR or directory != '.'):
+                    self.add_tree(path)
+                    for dirpath, _dirnames, filenames in os.walk(path):
+                        changed.update(os.path.join(dirpath, filename) for filename in filenames)
+                continue
+            if directory == '.' and path not in WATCHED_FILES:
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Portable watcher comparing (size, mtime) snapshots at a fixed interval"""
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    @staticmethod
+    def take_snapshot():
+        """Return {path: (size, mtime_ns)} for the summaries and watched files"""
+        snapshot = {}
+        for path in list(SummaryStore().iter_files()) + list(WATCHED_FILES):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout=None):
+        """Return the set of paths that changed since the previous call"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self.take_snapshot()
+            changed = {path for path in set(current) | set(self.snapshot)
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval if deadline is None else
+                       max(0.0, min(self.interval, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+def create_watcher(poll=False, interval=1.0):
+    """inotify where available, polling otherwise"""
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            print(f"Warning: inotify unavailable ({e}). Falling back to polling.")
+    return PollingWatcher(interval)
+
+def collect_changes(watcher, debounce):
+    """Block until something changes, then wait for the burst to settle
+
+    Returns the set of changed paths, or None if the watcher lost events.
+    """
+    paths = watcher.wait()
+    while paths is not None:
+        more = watcher.wait(debounce)
+        if more is None:
+            return None
+        if not more:
+            break
+        paths |= more
+    return paths
+
+def stale_changes(paths, manifest):
+    """Return a ChangeSet for paths, or None if a full run is needed
+
+    Summaries whose stat still matches the in-memory manifest (including
+    the ones this process just rewrote) are dropped.
+    """
+    changes = detect_changes(paths=sorted(paths))
+    if changes is None:
+        return None
+    changed = set()
+    for path in changes.changed:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if manifest.lookup(path, st) is None:
+            changed.add(path)
+    deleted = {path for path in changes.deleted if path in manifest.entries or path in (manifest.listing or ())}
+    return ChangeSet(changed, deleted)
+
+def watch(debounce=0.5, poll=False, interval=1.0):
+    """Run the pipeline once, then again after every change until interrupted"""
+    manifest = SummaryManifest()
+    run_pipeline(manifest=manifest)
+    watcher = create_watcher(poll, interval)
+    print(f"👀 Watching {SUMMARY_DIR}/, {' and '.join(WATCHED_FILES)} "
+          f"({type(watcher).__name__.replace('Watcher', '').lower()}). Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            paths = collect_changes(watcher, debounce)
+            changes = None if paths is None else stale_changes(paths, manifest)
+            if changes is not None and not changes.changed and not changes.deleted:
+                continue
+
+            started = time.perf_counter()
+            if changes is None:
+                print("\n🔄 Full update (config, template or lost events)")
+                reload_config()
+                # Reload from disk: entries classified against an older template
+                # (or START_DATE) are dropped, and so is the trust of incremental runs
+                manifest = SummaryManifest()
+            else:
+                print(f"\n🔄 {len(changes.changed)} changed, {len(changes.deleted)} deleted")
+            run_pipeline(changes, manifest)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"⏱️  [{datetime.now().strftime('%H:%M:%S')}] updated in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Update README.md and day counters whenever summaries change')
+    parser.add_argument('--debounce', type=float, default=0.5,
+                        help='Seconds without changes before updating (default: 0.5)')
+    parser.add_argument('--poll', action='store_true', help='Use polling instead of inotify')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Polling interval in seconds (default: 1.0)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings as JSON to stderr (same as SUMMARY_PROFILE=1)')
+    args = parser.parse_args()
+    setup_profiling('watch_summaries', args.profile)
+
+    watch(args.debounce, args.poll, args.interval)
+
+if __name__ == '__main__':
+    main()